@@ -7,19 +7,38 @@ Version: 2.0
 
 import argparse
 import csv
+import hashlib
 import json
 import os
 import sys
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from typing import List, Dict, Optional
 import time
 
-from seo_auditor import AdvancedSEOAuditor, SEOAuditResult
+from seo_auditor import AdvancedSEOAuditor, SEOAuditResult, save_reports_batch, _write_atomic
 from report_generator import AdvancedReportGenerator
 
 
+def audit_url(url: str, target_keyword: str = None, cache_dir: str = None) -> Optional[SEOAuditResult]:
+    """Audit a single URL (module-level so worker processes can run it)"""
+    try:
+        print(f"\n🔍 Auditing: {url}")
+        auditor = AdvancedSEOAuditor(url, target_keyword=target_keyword, cache_dir=cache_dir, verbose=False)
+        result = auditor.run_audit()
+        
+        if result:
+            print(f"   ✅ Score: {result.score}/100 (Grade: {result.grade})")
+            return result
+        else:
+            print(f"   ❌ Failed to audit")
+            return None
+            
+    except Exception as e:
+        print(f"   ❌ Error: {str(e)}")
+        return None
+
+
 class BatchAuditor:
     """Run SEO audits on multiple URLs"""
     
@@ -27,11 +46,13 @@ class BatchAuditor:
                  urls: List[str], 
                  target_keyword: str = None,
                  max_workers: int = 3,
-                 output_dir: str = "batch_reports"):
+                 output_dir: str = "batch_reports",
+                 cache_dir: str = None):
         self.urls = urls
         self.target_keyword = target_keyword
         self.max_workers = max_workers
         self.output_dir = output_dir
+        self.cache_dir = cache_dir
         self.results: List[SEOAuditResult] = []
         self.failed_urls: List[Dict] = []
         
@@ -40,28 +61,16 @@ class BatchAuditor:
     
     def audit_single_url(self, url: str) -> Optional[SEOAuditResult]:
         """Audit a single URL"""
-        try:
-            print(f"\n🔍 Auditing: {url}")
-            auditor = AdvancedSEOAuditor(url, target_keyword=self.target_keyword)
-            result = auditor.run_audit()
-            
-            if result:
-                print(f"   ✅ Score: {result.score}/100 (Grade: {result.grade})")
-                return result
-            else:
-                print(f"   ❌ Failed to audit")
-                return None
-                
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-            return None
+        return audit_url(url, self.target_keyword, self.cache_dir)
     
-    def run_batch_audit(self, parallel: bool = False) -> List[SEOAuditResult]:
+    def run_batch_audit(self, parallel: bool = False, use_processes: bool = False) -> List[SEOAuditResult]:
         """
         Run batch audit on all URLs
         
         Args:
             parallel: Run audits in parallel (faster but may trigger rate limits)
+            use_processes: With parallel, use worker processes instead of threads
+                so HTML parsing and analysis run on several cores
         """
         print(f"\n{'='*60}")
         print(f"🚀 Starting Batch SEO Audit")
@@ -73,7 +82,7 @@ class BatchAuditor:
         start_time = time.time()
         
         if parallel and self.max_workers > 1:
-            self._run_parallel()
+            self._run_parallel(ProcessPoolExecutor if use_processes else ThreadPoolExecutor)
         else:
             self._run_sequential()
         
@@ -103,11 +112,11 @@ class BatchAuditor:
             if i < len(self.urls):
                 time.sleep(1)
     
-    def _run_parallel(self):
+    def _run_parallel(self, executor_class=ThreadPoolExecutor):
         """Run audits in parallel"""
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with executor_class(max_workers=self.max_workers) as executor:
             future_to_url = {
-                executor.submit(self.audit_single_url, url): url 
+                executor.submit(audit_url, url, self.target_keyword, self.cache_dir): url 
                 for url in self.urls
             }
             
@@ -215,6 +224,12 @@ class BatchAuditor:
             for cat, scores in categories.items()
         }
     
+    @staticmethod
+    def _report_stem(result: SEOAuditResult, timestamp: str) -> str:
+        """File name stem for a page's reports; the URL hash keeps pages of one host from sharing a file"""
+        url_hash = hashlib.sha256(result.url.encode('utf-8')).hexdigest()[:8]
+        return f"{result.domain_slug}_{url_hash}_{timestamp}"
+    
     def save_reports(self, formats: List[str] = ["html", "json", "csv"]):
         """
         Save all reports in specified formats
@@ -231,11 +246,9 @@ class BatchAuditor:
             
             for result in self.results:
                 try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(result.url).netloc.replace(".", "_")
-                    filepath = os.path.join(html_dir, f"{domain}_{timestamp}.html")
+                    filepath = os.path.join(html_dir, f"{self._report_stem(result, timestamp)}.html")
                     generator = AdvancedReportGenerator(result)
-                    generator.save_html_report(filepath)
+                    _write_atomic(filepath, generator.generate_html_report().encode('utf-8'))
                 except Exception as e:
                     print(f"❌ Error saving HTML for {result.url}: {e}")
             
@@ -247,15 +260,10 @@ class BatchAuditor:
             os.makedirs(json_dir, exist_ok=True)
             
             # Individual reports
-            for result in self.results:
-                try:
-                    from urllib.parse import urlparse
-                    domain = urlparse(result.url).netloc.replace(".", "_")
-                    filepath = os.path.join(json_dir, f"{domain}_{timestamp}.json")
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(asdict(result), f, indent=2, default=str)
-                except Exception as e:
-                    print(f"❌ Error saving JSON for {result.url}: {e}")
+            save_reports_batch([
+                (result, os.path.join(json_dir, f"{self._report_stem(result, timestamp)}.json"))
+                for result in self.results
+            ], max_workers=self.max_workers)
             
             # Summary report
             summary_path = os.path.join(self.output_dir, f"batch_summary_{timestamp}.json")
@@ -525,6 +533,11 @@ Examples:
     parser.add_argument("-o", "--output", default="batch_reports", help="Output directory")
     parser.add_argument("--parallel", action="store_true", help="Run audits in parallel")
     parser.add_argument("-w", "--workers", type=int, default=3, help="Max parallel workers")
+    parser.add_argument("--processes", action="store_true",
+                       help="With --parallel, audit in separate processes (uses multiple CPU cores)")
+    parser.add_argument("--cache-dir",
+                       help="Cache pages and results here; unchanged pages are revalidated "
+                            "with conditional GETs and not re-audited")
     parser.add_argument("--formats", nargs="+", default=["html", "json", "csv"],
                        help="Output formats (html, json, csv)")
     
@@ -547,10 +560,11 @@ Examples:
         urls=urls,
         target_keyword=args.keyword,
         max_workers=args.workers,
-        output_dir=args.output
+        output_dir=args.output,
+        cache_dir=args.cache_dir
     )
     
-    results = auditor.run_batch_audit(parallel=args.parallel)
+    results = auditor.run_batch_audit(parallel=args.parallel, use_processes=args.processes)
     
     # Save reports
     if results:
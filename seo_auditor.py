@@ -6,20 +6,76 @@ Version: 2.0
 """
 
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin, parse_qs
+from urllib3.util import Retry
+from bs4 import BeautifulSoup, Doctype
+from urllib.parse import urlparse, urlsplit, urljoin, parse_qs
 import json
+import os
 import re
+import sys
 from datetime import datetime
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields, replace, MISSING
 from typing import Optional, List, Dict, Any, Tuple
 import time
 import hashlib
 from collections import Counter
+from functools import cached_property
+from operator import itemgetter
+from itertools import islice
+import heapq
 import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
 
-@dataclass
+# lxml parses in C; html.parser keeps the tool usable where lxml cannot be installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_TOKEN_RE = re.compile(r'\b\w+\b')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_FONT_SIZE_RE = re.compile(r'font-size:\s*(\d+)')
+_DIGIT_RE = re.compile(r'\d')
+
+_http = threading.local()
+
+
+def _http_session() -> requests.Session:
+    """Per-thread session so repeated audits reuse pooled keep-alive connections"""
+    session = getattr(_http, 'session', None)
+    if session is None:
+        session = _http.session = requests.Session()
+        # Keep pools for many hosts in multi-site batches; retry only failed
+        # connects, since a read retry could triple the 30s timeout
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=50,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    return session
+
+
+def _write_atomic(path: str, payload: bytes):
+    """Write via a temporary file so concurrent readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+@dataclass(slots=True, frozen=True)
 class SEOAuditResult:
     """Comprehensive data class to store 200+ audit parameters"""
     url: str
@@ -566,9 +622,6 @@ class SEOAuditResult:
     meta_score: int = 0
     heading_score: int = 0
     technical_score: int = 0
-    meta_tags_score: int = 0
-    headings_score: int = 0
-    technical_seo_score: int = 0
     viewport_configured: bool = False
     has_referrer_policy: bool = False
     preload_count: int = 0
@@ -584,15 +637,52 @@ class SEOAuditResult:
     links_new_window: int = 0
     
     total_checks: int = 300
-    checks_passed: int = 0
-    checks_failed: int = 0
-    checks_warnings: int = 0
+    
+    # Host with dots replaced, used to name saved reports
+    domain_slug: str = ''
+    
+    # Check counts are derived from the issue lists rather than stored
+    @property
+    def checks_passed(self) -> int:
+        return len(self.passed_checks)
+    
+    @property
+    def checks_failed(self) -> int:
+        return len(self.critical_issues)
+    
+    @property
+    def checks_warnings(self) -> int:
+        return len(self.warnings)
+    
+    # Names the report generators use for the category scores
+    @property
+    def meta_tags_score(self) -> int:
+        return self.meta_score
+    
+    @property
+    def headings_score(self) -> int:
+        return self.heading_score
+    
+    @property
+    def technical_seo_score(self) -> int:
+        return self.technical_score
+
+
+@dataclass(slots=True, frozen=True)
+class QuickAuditResult:
+    """Score-only audit result (see AdvancedSEOAuditor.quick_audit)"""
+    url: str
+    audit_date: str
+    score: int
+    grade: str
+    critical_issues: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
 
 
 class AdvancedSEOAuditor:
     """Enterprise-grade SEO Audit class with 200+ parameters"""
     
-    STOP_WORDS = {
+    STOP_WORDS = frozenset({
         'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'he',
         'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the', 'to', 'was', 'were', 'will',
         'with', 'the', 'this', 'but', 'they', 'have', 'had', 'what', 'when', 'where',
@@ -602,7 +692,7 @@ class AdvancedSEOAuditor:
         'your', 'my', 'our', 'their', 'his', 'her', 'about', 'into', 'through', 'during',
         'before', 'after', 'above', 'below', 'between', 'under', 'again', 'further',
         'then', 'once', 'here', 'there', 'any', 'if', 'or', 'because', 'until', 'while'
-    }
+    })
     
     POWER_WORDS = {
         'ultimate', 'complete', 'essential', 'proven', 'powerful', 'amazing', 'best',
@@ -611,6 +701,59 @@ class AdvancedSEOAuditor:
         'comprehensive', 'definitive', 'guide', 'tips', 'tricks', 'hacks', 'strategies'
     }
     
+    TITLE_FILLER_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'})
+    
+    # Page chrome excluded from content analysis
+    NON_CONTENT_TAGS = ('script', 'style', 'nav', 'footer', 'header', 'aside')
+    NON_LABELABLE_INPUTS = frozenset({'hidden', 'submit', 'button', 'reset'})
+    
+    # Substring patterns used by the class, style, path and text checks
+    DESCRIPTION_CTA_WORDS = ('learn', 'discover', 'get', 'find', 'try', 'start', 'buy', 'shop', 'read', 'click', 'download')
+    SHARE_PATTERNS = ('share', 'social-share', 'sharing', 'addthis', 'sharethis')
+    REVIEW_PATTERNS = ('review', 'testimonial', 'rating', 'stars')
+    BREADCRUMB_PATTERNS = ('breadcrumb', 'bread-crumb', 'breadcrumbs')
+    SYSTEM_PATH_PATTERNS = ('/search', '/cart', '/checkout', '/login', '/register', '/account', '/wishlist')
+    POPUP_PATTERNS = ('modal', 'popup', 'overlay', 'interstitial', 'lightbox')
+    AD_PATTERNS = ('advertisement', 'ad-slot', 'ad-container', 'adsense', 'ad-banner')
+    HIDDEN_STYLE_PATTERNS = ('display:none', 'visibility:hidden', 'font-size:0', 'color:white')
+    CTA_PHRASES = ('buy now', 'sign up', 'get started', 'learn more', 'contact us',
+                   'subscribe', 'download', 'shop now', 'order now', 'add to cart')
+    GENERIC_IMAGE_NAMES = ('image', 'img', 'photo', 'pic', 'picture', 'untitled', 'dsc', 'screenshot')
+    SEMANTIC_ELEMENTS = ('header', 'nav', 'main', 'article', 'section', 'aside', 'footer')
+    HAMBURGER_PATTERNS = ('hamburger', 'mobile-menu', 'menu-toggle', 'nav-toggle')
+    COMPELLING_WORDS = ('discover', 'learn', 'get', 'find', 'best', 'top', 'ultimate', 'free', 'easy', 'proven', 'exclusive')
+    LOW_CONTRAST_PATTERNS = ('color:#fff', 'color:white', 'color:#ccc', 'color:#ddd')
+    
+    SCORE_WEIGHTS = {
+        'meta': 15,
+        'headings': 10,
+        'images': 10,
+        'links': 10,
+        'technical': 20,
+        'content': 15,
+        'mobile_ux': 10,
+        'social': 5,
+        'ecommerce': 5
+    }
+    _SCORE_WEIGHT_TOTAL = sum(SCORE_WEIGHTS.values())
+    # Analyzer result key holding each category's score
+    _CATEGORY_SCORE_KEYS = {
+        'images': 'score', 'links': 'score', 'technical': 'security_headers_score',
+        'content': 'score', 'mobile_ux': 'score', 'social': 'score', 'ecommerce': 'score',
+        'crawling': 'score', 'content_quality': 'score', 'keyword': 'score',
+        'mobile_advanced': 'score', 'page_elements': 'score'
+    }
+    # Grade for a clamped 0-100 score, indexed by score // 10
+    _GRADE_BY_TENS = ('F', 'F', 'F', 'F', 'F', 'D', 'C', 'B', 'A', 'A+', 'A+')
+    
+    # Non-navigational href prefixes and the link counter each one feeds
+    _SPECIAL_HREF_KINDS = {'javascript:': 'javascript', '#': 'hash', 'mailto:': 'mailto', 'tel:': 'tel'}
+    
+    # Pages past this size are not audited; the download is cut off
+    _MAX_PAGE_BYTES = 5 * 1024 * 1024
+    
+    _VOWEL_TABLE = bytes(1 if chr(c) in 'aeiouy' else 0 for c in range(256))
+    
     SOCIAL_PATTERNS = {
         'facebook': r'facebook\.com|fb\.com',
         'twitter': r'twitter\.com|x\.com',
@@ -622,12 +765,20 @@ class AdvancedSEOAuditor:
         'github': r'github\.com',
         'reddit': r'reddit\.com'
     }
+    # (domain, platform) pairs in SOCIAL_PATTERNS order, so the first match picks the same platform.
+    # Each pattern only alternates escaped literal domains, so a substring test matches the same links.
+    _SOCIAL_DOMAINS = tuple((domain.replace('\\.', '.'), platform)
+                            for platform, pattern in SOCIAL_PATTERNS.items()
+                            for domain in pattern.split('|'))
     
-    def __init__(self, url: str, target_keyword: str = None):
+    def __init__(self, url: str, target_keyword: str = None, cache_dir: str = None, verbose: bool = True):
         self.url = self._normalize_url(url)
+        self.cache_dir = cache_dir
+        self.verbose = verbose
         self.target_keyword = target_keyword.lower() if target_keyword else None
         self.soup = None
         self.response = None
+        self._body = None
         self.headers = {}
         self.issues = {"critical": [], "warnings": [], "recommendations": [], "passed": []}
         self.response_time = 0
@@ -645,42 +796,365 @@ class AdvancedSEOAuditor:
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
         }
+        http_cache = self._http_cache_path()
+        stored = self._load_http_cache(http_cache) if http_cache else None
+        if stored:
+            # Conditional GET: an unchanged page answers 304 without a body
+            if stored.get('etag'):
+                request_headers['If-None-Match'] = stored['etag']
+            if stored.get('last_modified'):
+                request_headers['If-Modified-Since'] = stored['last_modified']
         try:
-            print(f"  → Fetching URL: {self.url}")
+            self._log(f"  → Fetching URL: {self.url}")
             start_time = time.time()
-            self.response = requests.get(self.url, headers=request_headers, timeout=30, allow_redirects=True)
+            session = _http_session()
+            session.cookies.clear()  # audits must not see cookies from earlier pages
+            # Stream so the headers can be checked before any body is downloaded
+            self._body = None
+            self.response = session.get(self.url, headers=request_headers, timeout=30,
+                                        allow_redirects=True, stream=True)
+            if stored and self.response.status_code == 304:
+                self.response.close()
+                self._log("  → Not modified since last audit, reusing stored page")
+                self._restore_from_http_cache(stored)
+            content_type = self.response.headers.get('Content-Type', '')
+            if content_type and 'html' not in content_type.lower():
+                self.response.close()
+                self._log(f"  ✗ Skipping {self.url}: not an HTML page ({content_type})")
+                return False
+            if self._body is None:
+                self._body = self._read_body()
+                if self._body is None:
+                    self._log(f"  ✗ Skipping {self.url}: page larger than {self._MAX_PAGE_BYTES // (1024 * 1024)} MB")
+                    return False
+            self._reset_page_cache()
             self.response_time = time.time() - start_time
-            print(f"  → Status Code: {self.response.status_code}")
-            print(f"  → Response Time: {self.response_time:.2f}s")
-            print(f"  → Content Length: {len(self.response.text)} chars")
+            if http_cache and self.response.status_code == 200:
+                self._store_http_cache(http_cache)
+            self._log(f"  → Status Code: {self.response.status_code}\n"
+                      f"  → Response Time: {self.response_time:.2f}s")
             self.response.raise_for_status()
-            self.soup = BeautifulSoup(self.response.text, 'html.parser')
+            # Parse the raw bytes: bs4 re-encodes str input for lxml anyway. A charset
+            # from Content-Type is authoritative; otherwise bs4 sniffs <meta charset>.
+            declared = self.response.encoding if 'charset=' in content_type.lower() else None
+            self.soup = BeautifulSoup(self._page_body, HTML_PARSER, from_encoding=declared)
+            self._log(f"  → Content Length: {self._html_text_len} chars")
             self.headers = dict(self.response.headers)
             
             # Debug: verify soup was created and has content
-            title = self.soup.find('title')
-            print(f"  → Title found: {title.get_text()[:50] if title else 'None'}...")
+            if self.verbose:
+                title = self._first('title')
+                self._log(f"  → Title found: {title.get_text()[:50] if title else 'None'}...")
             
             return True
         except requests.RequestException as e:
-            print(f"  ✗ Error fetching {self.url}: {e}")
+            self._log(f"  ✗ Error fetching {self.url}: {e}")
             return False
     
+    def _read_body(self) -> Optional[bytes]:
+        """Download the streamed body; None once it passes _MAX_PAGE_BYTES"""
+        response = self.response
+        declared = response.headers.get('Content-Length', '')
+        if declared.isdigit() and int(declared) > self._MAX_PAGE_BYTES:
+            response.close()
+            return None
+        chunks, size = [], 0
+        for chunk in response.iter_content(chunk_size=65536):
+            size += len(chunk)
+            if size > self._MAX_PAGE_BYTES:
+                response.close()
+                return None
+            chunks.append(chunk)
+        return b''.join(chunks)
+    
+    def _http_cache_path(self) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, 'http', f"{hashlib.sha256(self.url.encode('utf-8')).hexdigest()}.page")
+    
+    def _load_http_cache(self, path: str) -> Optional[dict]:
+        """Stored page: a JSON metadata line followed by the raw body"""
+        try:
+            with open(path, 'rb') as f:
+                meta, _, body = f.read().partition(b'\n')
+            stored = _json_loads(meta)
+        except (OSError, ValueError):
+            return None
+        stored['body'] = body
+        return stored
+    
+    def _store_http_cache(self, path: str):
+        headers = self.response.headers
+        if 'ETag' not in headers and 'Last-Modified' not in headers:
+            return
+        meta = {
+            'status_code': self.response.status_code,
+            'headers': dict(headers),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _write_atomic(path, json.dumps(meta).encode('utf-8') + b'\n' + self._page_body)
+        except OSError as e:
+            self._log(f"  ✗ Could not cache page: {e}")
+    
+    def _restore_from_http_cache(self, stored: dict):
+        """Turn a 304 into the stored response; the URL and redirect history stay live"""
+        headers = requests.structures.CaseInsensitiveDict(stored['headers'])
+        for name, value in self.response.headers.items():
+            if name.lower() not in self._BODY_HEADERS:
+                headers[name] = value
+        self.response.status_code = stored['status_code']
+        self.response.headers = headers
+        self.response.encoding = requests.utils.get_encoding_from_headers(headers)
+        self._body = stored['body']
+    
+    def _log(self, message: str):
+        """Write a progress message to stdout unless the auditor is quiet"""
+        if self.verbose:
+            sys.stdout.write(message + "\n")
+    
+    def _run_analyzers(self, steps: list) -> list:
+        """Run (progress label, analyzer) steps in order and collect their results"""
+        results = []
+        for label, analyzer in steps:
+            if label:
+                self._log(f"  ✓ {label}")
+            results.append(analyzer())
+        return results
+    
+    def _reset_page_cache(self):
+        """Drop values cached from a previously fetched page, including those a subclass inherits"""
+        for klass in type(self).__mro__:
+            for name, attr in vars(klass).items():
+                if isinstance(attr, cached_property):
+                    self.__dict__.pop(name, None)
+    
+    @cached_property
+    def _parsed_url(self):
+        return urlparse(self.url)
+    
+    @cached_property
+    def _page_body(self) -> bytes:
+        """Raw page bytes; a response handed in by the caller (the Streamlit app) keeps them itself"""
+        return self._body if self._body is not None else self.response.content
+    
+    @cached_property
+    def _html_text(self) -> str:
+        """The page decoded with its declared charset, else the one the parser detected, computed once"""
+        if self._body is None:
+            return self.response.text
+        encoding = None
+        if 'charset=' not in self.response.headers.get('Content-Type', '').lower() and self.soup is not None:
+            encoding = self.soup.original_encoding
+        encoding = encoding or self.response.encoding or requests.compat.chardet.detect(self._body)['encoding']
+        try:
+            return str(self._body, encoding, errors='replace')
+        except (LookupError, TypeError):
+            return str(self._body, errors='replace')
+    
+    @cached_property
+    def _html_text_len(self) -> int:
+        return len(self._html_text)
+    
+    @cached_property
+    def _html_bytes_len(self) -> int:
+        return len(self._page_body)
+    
+    @cached_property
+    def _html_utf8_len(self) -> int:
+        # The raw body already is the UTF-8 encoding of the text for UTF-8 pages
+        encoding = (self.response.encoding or '').lower().replace('_', '-')
+        if encoding in ('utf-8', 'utf8'):
+            return self._html_bytes_len
+        return len(self._html_text.encode('utf-8'))
+    
+    @cached_property
+    def _anchors(self) -> list:
+        """All <a href> elements, shared by the link-based analyzers"""
+        return [el for el in self._elements('a') if el.get('href') is not None]
+    
+    @cached_property
+    def _image_anchor_ids(self) -> set:
+        """ids of anchors wrapping an image, found from the images up instead of searching every link"""
+        return {id(parent) for img in self._elements('img')
+                for parent in img.parents if parent.name == 'a'}
+    
+    @cached_property
+    def _full_text(self) -> str:
+        return self.soup.get_text(separator=' ')
+    
+    @cached_property
+    def _full_text_lower(self) -> str:
+        return self._full_text.lower()
+    
+    @cached_property
+    def _keyword_text_lower(self) -> str:
+        """Lowercased page text joined without a separator, as keyword density has always been measured"""
+        return self.soup.get_text().lower()
+    
+    @cached_property
+    def _word_list(self) -> list:
+        """Alphabetic words of the lowercased page text"""
+        return _WORD_RE.findall(self._full_text_lower)
+    
+    @cached_property
+    def _dom_index(self) -> dict:
+        """Elements bucketed by tag/attribute presence in a single tree walk"""
+        index = {
+            'tags': {}, 'scripts_with_src': [], 'scripts_without_src': [], 'stylesheets': [],
+            'itemtype': [], 'typeof': [], 'classed': [], 'styled': [],
+            'role': [], 'aria-label': [], 'tabindex': [], 'time_meta': []
+        }
+        tags = index['tags']
+        for el in self.soup.find_all(True):
+            name = el.name
+            attrs = el.attrs
+            bucket = tags.get(name)
+            if bucket is None:
+                bucket = tags[name] = []
+            bucket.append(el)
+            
+            if name == 'script':
+                if 'src' in attrs:
+                    index['scripts_with_src'].append(el)
+                if not attrs.get('src'):
+                    index['scripts_without_src'].append(el)
+            elif name == 'link' and 'stylesheet' in (attrs.get('rel') or ()):
+                index['stylesheets'].append(el)
+            elif name == 'time' or name == 'meta':
+                index['time_meta'].append(el)
+            
+            classes = attrs.get('class')
+            if classes:
+                if not isinstance(classes, str):
+                    classes = ' '.join(classes)
+                index['classed'].append((el, classes.lower()))
+            for attr in ('itemtype', 'typeof', 'role', 'aria-label', 'tabindex'):
+                if attr in attrs:
+                    index[attr].append(el)
+            if 'style' in attrs:
+                index['styled'].append(el)
+        return index
+    
+    def _elements(self, *names: str) -> list:
+        """Indexed elements with the given tag name(s); do not mutate the result"""
+        tags = self._dom_index['tags']
+        if len(names) == 1:
+            return tags.get(names[0], [])
+        return [el for name in names for el in tags.get(name, [])]
+    
+    def _count(self, *names: str) -> int:
+        tags = self._dom_index['tags']
+        return sum(len(tags.get(name, ())) for name in names)
+    
+    def _first(self, name: str):
+        elements = self._dom_index['tags'].get(name)
+        return elements[0] if elements else None
+    
+    def _has_role(self, role: str) -> bool:
+        return any(el.get('role') == role for el in self._dom_index['role'])
+    
+    def _find_by_class(self, pattern: str, name: str = None):
+        """First element whose class attribute contains pattern (case-insensitive)"""
+        if pattern not in self._class_text:
+            return None
+        for el, classes in self._dom_index['classed']:
+            if pattern in classes and (name is None or el.name == name):
+                return el
+        return None
+    
+    @cached_property
+    def _compact_styles(self) -> list:
+        """(element, lowercased style attribute with spaces removed) pairs"""
+        return [(el, el.get('style', '').lower().replace(' ', '')) for el in self._dom_index['styled']]
+    
+    @cached_property
+    def _class_text(self) -> str:
+        """All lowercased class attributes, one element per line"""
+        return '\n'.join(classes for _, classes in self._dom_index['classed'])
+    
+    def _has_class(self, *patterns: str) -> bool:
+        return any(p in self._class_text for p in patterns)
+    
+    def _links_with_rel(self, rel: str) -> list:
+        return [el for el in self._elements('link') if rel in (el.get('rel') or ())]
+    
+    def _links_rel_containing(self, fragment: str) -> list:
+        return [el for el in self._elements('link') if fragment in ' '.join(el.get('rel') or ()).lower()]
+    
+    def _find_link(self, rel: str):
+        for el in self._elements('link'):
+            if rel in (el.get('rel') or ()):
+                return el
+        return None
+    
+    @cached_property
+    def _meta_description(self):
+        return self._find_meta('name', 'description')
+    
+    @cached_property
+    def _viewport(self):
+        return self._find_meta('name', 'viewport')
+    
+    @cached_property
+    def _meta_index(self) -> dict:
+        """First <meta> per (attr, value) pair, and per (attr, True) for attribute presence"""
+        index = {}
+        for el in self._elements('meta'):
+            for attr, value in el.attrs.items():
+                index.setdefault((attr, True), el)
+                if isinstance(value, str):
+                    index.setdefault((attr, value), el)
+        return index
+    
+    @cached_property
+    def _heading_texts(self) -> dict:
+        """Unstripped get_text() of every h1-h6, by tag, in document order"""
+        return {f'h{level}': [h.get_text() for h in self._elements(f'h{level}')] for level in range(1, 7)}
+    
+    def _find_meta(self, attr: str, value=True):
+        """First <meta> whose attr equals value (or is merely present when value is True)"""
+        return self._meta_index.get((attr, value))
+    
+    def _ld_json_scripts(self) -> list:
+        return [el for el in self._elements('script') if el.get('type') == 'application/ld+json']
+    
+    @cached_property
+    def _ld_json(self) -> list:
+        """Schema objects from every ld+json script, with @graph entries expanded"""
+        all_schemas = []
+        for script in self._ld_json_scripts():
+            try:
+                if script.string:
+                    data = _json_loads(str(script.string))
+                    if isinstance(data, dict):
+                        all_schemas.append(data)
+                        if '@graph' in data:
+                            all_schemas.extend(data['@graph'])
+                    elif isinstance(data, list):
+                        all_schemas.extend(data)
+            except:
+                pass
+        return all_schemas
+    
     def analyze_title(self) -> dict:
-        title_tag = self.soup.find('title')
+        title_tag = self._first('title')
         title = title_tag.get_text().strip() if title_tag else None
         length = len(title) if title else 0
         pixel_width = int(length * 6.5) if title else 0
         
+        title_lower = title.lower() if title else ''
         has_keyword = False
         if title and self.target_keyword:
-            has_keyword = self.target_keyword.lower() in title.lower()
+            has_keyword = self.target_keyword in title_lower
         
-        has_numbers = bool(re.search(r'\d', title)) if title else False
+        has_numbers = bool(_DIGIT_RE.search(title)) if title else False
         
         has_power_words = False
         if title:
-            title_words = set(title.lower().split())
+            title_words = set(title_lower.split())
             has_power_words = bool(title_words & self.POWER_WORDS)
         
         if not title:
@@ -709,16 +1183,16 @@ class AdvancedSEOAuditor:
         }
     
     def analyze_meta_description(self) -> dict:
-        meta_desc = self.soup.find('meta', attrs={'name': 'description'})
+        meta_desc = self._meta_description
         description = meta_desc.get('content', '').strip() if meta_desc else None
         length = len(description) if description else 0
         
+        description_lower = description.lower() if description else ''
         has_keyword = False
         if description and self.target_keyword:
-            has_keyword = self.target_keyword.lower() in description.lower()
+            has_keyword = self.target_keyword in description_lower
         
-        cta_words = ['learn', 'discover', 'get', 'find', 'try', 'start', 'buy', 'shop', 'read', 'click', 'download']
-        has_cta = any(word in description.lower() for word in cta_words) if description else False
+        has_cta = any(word in description_lower for word in self.DESCRIPTION_CTA_WORDS)
         
         if not description:
             status = "❌ Missing"
@@ -744,12 +1218,12 @@ class AdvancedSEOAuditor:
     def analyze_meta_tags(self) -> dict:
         result = {}
         
-        meta_kw = self.soup.find('meta', attrs={'name': 'keywords'})
+        meta_kw = self._find_meta('name', 'keywords')
         keywords = meta_kw.get('content', '').strip() if meta_kw else None
         result['keywords'] = keywords
         result['keywords_count'] = len(keywords.split(',')) if keywords else 0
         
-        canonical = self.soup.find('link', attrs={'rel': 'canonical'})
+        canonical = self._find_link('canonical')
         canonical_url = canonical.get('href') if canonical else None
         result['canonical_url'] = canonical_url
         result['canonical_is_self'] = canonical_url == self.url if canonical_url else False
@@ -759,7 +1233,7 @@ class AdvancedSEOAuditor:
         else:
             self.issues["passed"].append("Canonical URL is set")
         
-        robots = self.soup.find('meta', attrs={'name': 'robots'})
+        robots = self._find_meta('name', 'robots')
         robots_content = robots.get('content', '').lower() if robots else ''
         result['robots_meta'] = robots_content or None
         result['robots_index'] = 'noindex' not in robots_content
@@ -769,7 +1243,7 @@ class AdvancedSEOAuditor:
             self.issues["critical"].append("Page is set to noindex - Will not appear in search results")
         
         for name in ['author', 'publisher', 'copyright', 'language', 'revisit-after', 'rating', 'referrer']:
-            meta = self.soup.find('meta', attrs={'name': name})
+            meta = self._find_meta('name', name)
             result[f'meta_{name.replace("-", "_")}'] = meta.get('content') if meta else None
         
         return result
@@ -782,7 +1256,7 @@ class AdvancedSEOAuditor:
         ]
         
         for prop in og_properties:
-            meta = self.soup.find('meta', attrs={'property': prop})
+            meta = self._find_meta('property', prop)
             key = prop.replace('og:', '').replace(':', '_')
             og_tags[key] = meta.get('content') if meta else None
         
@@ -807,7 +1281,7 @@ class AdvancedSEOAuditor:
         ]
         
         for prop in twitter_properties:
-            meta = self.soup.find('meta', attrs={'name': prop})
+            meta = self._find_meta('name', prop)
             key = prop.replace('twitter:', '').replace(':', '_')
             twitter_tags[key] = meta.get('content') if meta else None
         
@@ -826,12 +1300,16 @@ class AdvancedSEOAuditor:
     def analyze_headings(self) -> dict:
         headings = {}
         
+        # Stripped text of every heading, h1 first
+        all_texts = []
+        heading_texts = self._heading_texts
         for level in range(1, 7):
             tag = f'h{level}'
-            elements = self.soup.find_all(tag)
-            headings[f'{tag}_count'] = len(elements)
+            texts = [text.strip() for text in heading_texts[tag]]
+            all_texts.extend(texts)
+            headings[f'{tag}_count'] = len(texts)
             if level <= 3:
-                headings[f'{tag}_tags'] = [h.get_text().strip()[:100] for h in elements]
+                headings[f'{tag}_tags'] = [text[:100] for text in texts]
         
         h1_tags = headings.get('h1_tags', [])
         h1_count = headings['h1_count']
@@ -849,23 +1327,19 @@ class AdvancedSEOAuditor:
             hierarchy_valid = False
         headings['hierarchy_valid'] = hierarchy_valid
         
-        all_headings = []
-        for level in range(1, 7):
-            all_headings.extend(self.soup.find_all(f'h{level}'))
-        
-        empty = sum(1 for h in all_headings if not h.get_text().strip())
+        empty = sum(1 for text in all_texts if not text)
         headings['empty_headings'] = empty
         
-        heading_texts = [h.get_text().strip().lower() for h in all_headings if h.get_text().strip()]
+        heading_texts = [text.lower() for text in all_texts if text]
         duplicates = len(heading_texts) - len(set(heading_texts))
         headings['duplicate_headings'] = duplicates
         
-        long_count = sum(1 for h in all_headings if len(h.get_text().strip()) > 70)
+        long_count = sum(1 for text in all_texts if len(text) > 70)
         headings['long_headings'] = long_count
         
         has_keyword = False
         if self.target_keyword and h1_tags:
-            has_keyword = any(self.target_keyword.lower() in h.lower() for h in h1_tags)
+            has_keyword = any(self.target_keyword in h.lower() for h in h1_tags)
         headings['h1_has_keyword'] = has_keyword
         
         if h1_count == 0:
@@ -891,83 +1365,91 @@ class AdvancedSEOAuditor:
         return headings
     
     def analyze_images(self) -> dict:
-        images = self.soup.find_all('img')
+        images = self._elements('img')
         total = len(images)
         
-        result = {
-            'total': total,
-            'without_alt': 0,
-            'with_empty_alt': 0,
-            'with_title': 0,
-            'without_src': 0,
-            'with_lazy_loading': 0,
-            'with_srcset': 0,
-            'with_sizes': 0,
-            'webp': 0, 'svg': 0, 'png': 0, 'jpg': 0, 'gif': 0,
-            'external': 0, 'internal': 0,
-            'with_descriptive_filename': 0,
-            'decorative': 0,
-            'alt_lengths': []
-        }
+        # Tally into locals and build the result dict once after the loop
+        without_alt = with_empty_alt = with_title = without_src = 0
+        with_lazy_loading = with_srcset = with_sizes = 0
+        webp = svg = png = jpg = gif = 0
+        external = internal = with_descriptive_filename = 0
+        alt_lengths = []
         
-        parsed_url = urlparse(self.url)
-        base_domain = parsed_url.netloc
+        base_domain = self._parsed_url.netloc
+        generic_names = self.GENERIC_IMAGE_NAMES
         
         for img in images:
-            src = img.get('src', '')
-            alt = img.get('alt')
+            attrs = img.attrs
+            src = attrs.get('src', '')
+            alt = attrs.get('alt')
             
             if alt is None:
-                result['without_alt'] += 1
+                without_alt += 1
             elif alt.strip() == '':
-                result['with_empty_alt'] += 1
-                result['decorative'] += 1
+                with_empty_alt += 1
             else:
-                result['alt_lengths'].append(len(alt))
+                alt_lengths.append(len(alt))
             
-            if img.get('title'):
-                result['with_title'] += 1
+            if attrs.get('title'):
+                with_title += 1
             
             if not src:
-                result['without_src'] += 1
+                without_src += 1
             
-            if img.get('loading') == 'lazy' or 'lazy' in str(img.get('class', [])):
-                result['with_lazy_loading'] += 1
+            if attrs.get('loading') == 'lazy':
+                with_lazy_loading += 1
+            else:
+                classes = attrs.get('class') or ()
+                if isinstance(classes, str):
+                    classes = (classes,)
+                if any('lazy' in c for c in classes):
+                    with_lazy_loading += 1
             
-            if img.get('srcset'):
-                result['with_srcset'] += 1
-            if img.get('sizes'):
-                result['with_sizes'] += 1
+            if attrs.get('srcset'):
+                with_srcset += 1
+            if attrs.get('sizes'):
+                with_sizes += 1
             
             src_lower = src.lower()
             if '.webp' in src_lower:
-                result['webp'] += 1
+                webp += 1
             elif '.svg' in src_lower:
-                result['svg'] += 1
+                svg += 1
             elif '.png' in src_lower:
-                result['png'] += 1
+                png += 1
             elif '.jpg' in src_lower or '.jpeg' in src_lower:
-                result['jpg'] += 1
+                jpg += 1
             elif '.gif' in src_lower:
-                result['gif'] += 1
+                gif += 1
             
-            if src.startswith('http'):
-                img_domain = urlparse(src).netloc
-                if img_domain == base_domain:
-                    result['internal'] += 1
-                else:
-                    result['external'] += 1
+            if src.startswith('http') and urlsplit(src).netloc != base_domain:
+                external += 1
             else:
-                result['internal'] += 1
+                internal += 1
             
             if src:
                 filename = src.split('/')[-1].split('?')[0].lower()
-                generic_names = ['image', 'img', 'photo', 'pic', 'picture', 'untitled', 'dsc', 'screenshot']
-                if not any(g in filename for g in generic_names) and len(filename) > 5:
-                    result['with_descriptive_filename'] += 1
+                if len(filename) > 5 and not any(g in filename for g in generic_names):
+                    with_descriptive_filename += 1
+        
+        result = {
+            'total': total,
+            'without_alt': without_alt,
+            'with_empty_alt': with_empty_alt,
+            'with_title': with_title,
+            'without_src': without_src,
+            'with_lazy_loading': with_lazy_loading,
+            'with_srcset': with_srcset,
+            'with_sizes': with_sizes,
+            'webp': webp, 'svg': svg, 'png': png, 'jpg': jpg, 'gif': gif,
+            'external': external, 'internal': internal,
+            'with_descriptive_filename': with_descriptive_filename,
+            'decorative': with_empty_alt,
+            'alt_lengths': alt_lengths
+        }
         
-        result['figure_elements'] = len(self.soup.find_all('figure'))
-        result['images_in_picture'] = len(self.soup.find_all('picture'))
+        result['figure_elements'] = self._count('figure')
+        result['images_in_picture'] = self._count('picture')
         
         if result['alt_lengths']:
             result['avg_alt_length'] = sum(result['alt_lengths']) / len(result['alt_lengths'])
@@ -1013,90 +1495,98 @@ class AdvancedSEOAuditor:
         return result
     
     def analyze_links(self) -> dict:
-        links = self.soup.find_all('a', href=True)
-        parsed_url = urlparse(self.url)
-        base_domain = parsed_url.netloc
-        
-        result = {
-            'internal': 0, 'external': 0, 'total': len(links),
-            'unique_internal': set(), 'unique_external': set(),
-            'nofollow': 0, 'dofollow': 0, 'sponsored': 0, 'ugc': 0,
-            'with_title': 0, 'without_title': 0,
-            'with_target_blank': 0, 'with_rel_noopener': 0, 'without_noopener': 0,
-            'empty_anchor': 0, 'image_links': 0, 'text_links': 0,
-            'javascript': 0, 'hash': 0, 'mailto': 0, 'tel': 0,
-            'anchor_texts': [],
-            'broken': []
-        }
+        links = self._anchors
+        base_domain = self._parsed_url.netloc
+        
+        # Tally into locals and build the result dict once after the loop
+        internal = external = nofollow = dofollow = sponsored = ugc = 0
+        with_title = without_title = with_target_blank = with_rel_noopener = without_noopener = 0
+        empty_anchor = image_links = text_links = 0
+        href_kinds = self._SPECIAL_HREF_KINDS
+        special_prefixes = tuple(href_kinds)
+        special = dict.fromkeys(href_kinds.values(), 0)
+        anchor_texts = Counter()
+        
+        # Only the counts are reported, so keep URL hashes rather than the strings
+        unique_internal = set()
+        unique_external = set()
+        # Navigation repeats the same hrefs, so resolve each distinct one once
+        resolved = {}
+        
+        image_anchors = self._image_anchor_ids
         
         for link in links:
-            href = link.get('href', '')
-            rel = link.get('rel', [])
+            attrs = link.attrs
+            href = attrs.get('href', '')
+            rel = attrs.get('rel', [])
             if isinstance(rel, str):
                 rel = rel.split()
             
-            if href.startswith('javascript:'):
-                result['javascript'] += 1
-                continue
-            elif href.startswith('#'):
-                result['hash'] += 1
-                continue
-            elif href.startswith('mailto:'):
-                result['mailto'] += 1
-                continue
-            elif href.startswith('tel:'):
-                result['tel'] += 1
+            # One prefix test lets ordinary links through; the rest are only counted
+            if href.startswith(special_prefixes):
+                special[href_kinds['#' if href[0] == '#' else href.split(':', 1)[0] + ':']] += 1
                 continue
             
-            full_url = urljoin(self.url, href)
-            link_domain = urlparse(full_url).netloc
+            target = resolved.get(href)
+            if target is None:
+                full_url = urljoin(self.url, href)
+                target = resolved[href] = (full_url, urlsplit(full_url).netloc)
+            full_url, link_domain = target
             
             if link_domain == base_domain or not link_domain:
-                result['internal'] += 1
-                result['unique_internal'].add(full_url)
+                internal += 1
+                unique_internal.add(hash(full_url))
             else:
-                result['external'] += 1
-                result['unique_external'].add(full_url)
+                external += 1
+                unique_external.add(hash(full_url))
             
             if 'nofollow' in rel:
-                result['nofollow'] += 1
+                nofollow += 1
             else:
-                result['dofollow'] += 1
+                dofollow += 1
             
             if 'sponsored' in rel:
-                result['sponsored'] += 1
+                sponsored += 1
             if 'ugc' in rel:
-                result['ugc'] += 1
+                ugc += 1
             
-            if link.get('title'):
-                result['with_title'] += 1
+            if attrs.get('title'):
+                with_title += 1
             else:
-                result['without_title'] += 1
+                without_title += 1
             
-            if link.get('target') == '_blank':
-                result['with_target_blank'] += 1
+            if attrs.get('target') == '_blank':
+                with_target_blank += 1
                 if 'noopener' in rel or 'noreferrer' in rel:
-                    result['with_rel_noopener'] += 1
+                    with_rel_noopener += 1
                 else:
-                    result['without_noopener'] += 1
+                    without_noopener += 1
             
             anchor_text = link.get_text().strip()
             if not anchor_text:
-                result['empty_anchor'] += 1
+                empty_anchor += 1
             else:
-                result['anchor_texts'].append(anchor_text.lower())
+                anchor_texts[anchor_text.lower()] += 1
             
-            if link.find('img'):
-                result['image_links'] += 1
+            if id(link) in image_anchors:
+                image_links += 1
             else:
-                result['text_links'] += 1
+                text_links += 1
         
-        result['unique_internal'] = len(result['unique_internal'])
-        result['unique_external'] = len(result['unique_external'])
-        
-        anchor_counter = Counter(result['anchor_texts'])
-        result['anchor_distribution'] = dict(anchor_counter.most_common(10))
-        del result['anchor_texts']
+        result = {
+            'internal': internal, 'external': external, 'total': len(links),
+            'nofollow': nofollow, 'dofollow': dofollow, 'sponsored': sponsored, 'ugc': ugc,
+            'with_title': with_title, 'without_title': without_title,
+            'with_target_blank': with_target_blank, 'with_rel_noopener': with_rel_noopener,
+            'without_noopener': without_noopener,
+            'empty_anchor': empty_anchor, 'image_links': image_links, 'text_links': text_links,
+            'javascript': special['javascript'], 'hash': special['hash'],
+            'mailto': special['mailto'], 'tel': special['tel'],
+            'broken': [],
+            'unique_internal': len(unique_internal),
+            'unique_external': len(unique_external),
+            'anchor_distribution': dict(anchor_texts.most_common(10)),
+        }
         
         score = 100
         if result['internal'] < 3:
@@ -1130,7 +1620,7 @@ class AdvancedSEOAuditor:
         else:
             self.issues["passed"].append("Website uses HTTPS")
         
-        viewport = self.soup.find('meta', attrs={'name': 'viewport'})
+        viewport = self._viewport
         result['has_viewport'] = viewport is not None
         result['viewport_content'] = viewport.get('content') if viewport else None
         
@@ -1142,8 +1632,8 @@ class AdvancedSEOAuditor:
         else:
             self.issues["critical"].append("Missing viewport meta tag - Mobile unfriendly")
         
-        charset = self.soup.find('meta', attrs={'charset': True})
-        charset_http = self.soup.find('meta', attrs={'http-equiv': 'Content-Type'})
+        charset = self._find_meta('charset')
+        charset_http = self._find_meta('http-equiv', 'Content-Type')
         result['has_charset'] = charset is not None or charset_http is not None
         result['charset_value'] = charset.get('charset') if charset else None
         
@@ -1152,16 +1642,17 @@ class AdvancedSEOAuditor:
         else:
             self.issues["warnings"].append("Missing charset declaration")
         
-        result['has_doctype'] = '<!doctype' in str(self.soup)[:100].lower()
+        # The doctype is a top-level node; no need to serialize the whole page to find it
+        result['has_doctype'] = any(isinstance(node, Doctype) for node in self.soup.contents)
         
-        html_tag = self.soup.find('html')
+        html_tag = self._first('html')
         result['html_lang'] = html_tag.get('lang') if html_tag else None
         if not result['html_lang']:
             self.issues["warnings"].append("Missing lang attribute on html tag")
         else:
             self.issues["passed"].append("HTML lang attribute is set")
         
-        favicon = self.soup.find('link', attrs={'rel': lambda x: x and 'icon' in x.lower() if x else False})
+        favicon = (self._links_rel_containing('icon') or [None])[0]
         result['has_favicon'] = favicon is not None
         if favicon:
             href = favicon.get('href', '')
@@ -1170,35 +1661,18 @@ class AdvancedSEOAuditor:
         else:
             self.issues["warnings"].append("Missing favicon")
         
-        apple_icon = self.soup.find('link', attrs={'rel': 'apple-touch-icon'})
+        apple_icon = self._find_link('apple-touch-icon')
         result['has_apple_touch_icon'] = apple_icon is not None
         
-        manifest = self.soup.find('link', attrs={'rel': 'manifest'})
+        manifest = self._find_link('manifest')
         result['has_manifest'] = manifest is not None
         result['manifest_url'] = manifest.get('href') if manifest else None
         
-        schema_scripts = self.soup.find_all('script', attrs={'type': 'application/ld+json'})
+        schema_scripts = self._ld_json_scripts()
         result['has_schema'] = len(schema_scripts) > 0
         result['schema_count'] = len(schema_scripts)
-        result['schema_types'] = []
-        
-        for script in schema_scripts:
-            try:
-                if script.string:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        if '@type' in data:
-                            result['schema_types'].append(data['@type'])
-                        if '@graph' in data:
-                            for item in data['@graph']:
-                                if '@type' in item:
-                                    result['schema_types'].append(item['@type'])
-                    elif isinstance(data, list):
-                        for item in data:
-                            if isinstance(item, dict) and '@type' in item:
-                                result['schema_types'].append(item['@type'])
-            except:
-                pass
+        result['schema_types'] = [schema['@type'] for schema in self._ld_json
+                                  if isinstance(schema, dict) and '@type' in schema]
         
         if result['has_schema']:
             # Flatten and stringify schema types to avoid non-string items
@@ -1216,26 +1690,27 @@ class AdvancedSEOAuditor:
         else:
             self.issues["recommendations"].append("Add Schema.org structured data markup")
         
-        result['microdata_items'] = len(self.soup.find_all(attrs={'itemtype': True}))
-        result['rdfa_items'] = len(self.soup.find_all(attrs={'typeof': True}))
+        dom = self._dom_index
+        result['microdata_items'] = len(dom['itemtype'])
+        result['rdfa_items'] = len(dom['typeof'])
         
-        result['total_css_files'] = len(self.soup.find_all('link', attrs={'rel': 'stylesheet'}))
-        result['total_js_files'] = len(self.soup.find_all('script', attrs={'src': True}))
+        result['total_css_files'] = len(dom['stylesheets'])
+        result['total_js_files'] = len(dom['scripts_with_src'])
         
-        style_tags = self.soup.find_all('style')
+        style_tags = self._elements('style')
         result['inline_css_count'] = len(style_tags)
         result['inline_css_size'] = sum(len(s.get_text()) for s in style_tags)
         
-        script_tags = [s for s in self.soup.find_all('script') if not s.get('src')]
+        script_tags = dom['scripts_without_src']
         result['inline_js_count'] = len(script_tags)
         result['inline_js_size'] = sum(len(s.get_text()) for s in script_tags)
         
-        all_scripts = self.soup.find_all('script', attrs={'src': True})
+        all_scripts = dom['scripts_with_src']
         result['async_js'] = sum(1 for s in all_scripts if s.get('async'))
         result['defer_js'] = sum(1 for s in all_scripts if s.get('defer'))
         result['render_blocking_js'] = result['total_js_files'] - result['async_js'] - result['defer_js']
         
-        css_links = self.soup.find_all('link', attrs={'rel': 'stylesheet'})
+        css_links = dom['stylesheets']
         result['render_blocking_css'] = sum(1 for c in css_links if not c.get('media') or c.get('media') == 'all')
         
         result['http_status'] = self.response.status_code
@@ -1269,9 +1744,9 @@ class AdvancedSEOAuditor:
         if result['security_headers_score'] < 40:
             self.issues["warnings"].append(f"Security headers incomplete ({result['security_headers_score']}%)")
         
-        result['page_size_bytes'] = len(self.response.content)
+        result['page_size_bytes'] = self._html_bytes_len
         result['page_size_kb'] = round(result['page_size_bytes'] / 1024, 2)
-        result['html_size_bytes'] = len(self.response.text.encode('utf-8'))
+        result['html_size_bytes'] = self._html_utf8_len
         
         if result['page_size_kb'] > 3000:
             self.issues["warnings"].append(f"Page size is large ({result['page_size_kb']}KB)")
@@ -1281,23 +1756,30 @@ class AdvancedSEOAuditor:
     def analyze_content(self) -> dict:
         result = {}
         
-        soup_copy = BeautifulSoup(str(self.soup), 'html.parser')
-        for element in soup_copy(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-            element.decompose()
+        # Everything inside page chrome is left out of the content analysis
+        skip = set()
+        for element in self._elements(*self.NON_CONTENT_TAGS):
+            if id(element) not in skip:
+                skip.add(id(element))
+                skip.update(map(id, element.descendants))
+        
+        def count(*names):
+            return sum(1 for el in self._elements(*names) if id(el) not in skip)
         
-        text = soup_copy.get_text(separator=' ')
+        text = ' '.join(s for s in self.soup.strings if id(s) not in skip)
         text = ' '.join(text.split())
         
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        words = _WORD_RE.findall(text.lower())
+        # Per-word work below runs once per distinct word, weighted by its count
+        word_counts = Counter(words)
         result['word_count'] = len(words)
         result['character_count'] = len(text)
         
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
         result['sentence_count'] = len(sentences)
         
-        paragraphs = soup_copy.find_all('p')
-        result['paragraph_count'] = len(paragraphs)
+        result['paragraph_count'] = count('p')
         
         if sentences:
             result['avg_sentence_length'] = round(len(words) / len(sentences), 1)
@@ -1305,11 +1787,11 @@ class AdvancedSEOAuditor:
             result['avg_sentence_length'] = 0
         
         if words:
-            result['avg_word_length'] = round(sum(len(w) for w in words) / len(words), 1)
+            result['avg_word_length'] = round(sum(len(w) * n for w, n in word_counts.items()) / len(words), 1)
         else:
             result['avg_word_length'] = 0
         
-        syllables = sum(self._count_syllables(w) for w in words)
+        syllables = sum(self._count_syllables(w) * n for w, n in word_counts.items())
         if result['sentence_count'] > 0 and result['word_count'] > 0:
             asl = result['word_count'] / result['sentence_count']
             asw = syllables / result['word_count']
@@ -1327,52 +1809,59 @@ class AdvancedSEOAuditor:
         else:
             result['readability_status'] = "❌ Very Difficult"
         
-        html_length = len(self.response.text)
+        html_length = self._html_text_len
         result['text_html_ratio'] = round((len(text) / html_length) * 100, 1) if html_length else 0
         
         if result['text_html_ratio'] < 10:
             self.issues["warnings"].append(f"Low text-to-HTML ratio ({result['text_html_ratio']}%)")
         
-        unique_words = set(words)
-        result['unique_words'] = len(unique_words)
-        result['lexical_density'] = round((len(unique_words) / len(words)) * 100, 1) if words else 0
-        
-        content_words = [w for w in words if w not in self.STOP_WORDS and len(w) > 2]
-        word_freq = Counter(content_words)
-        result['top_keywords'] = word_freq.most_common(10)
-        
-        if content_words:
+        result['unique_words'] = len(word_counts)
+        result['lexical_density'] = round((len(word_counts) / len(words)) * 100, 1) if words else 0
+        
+        # One pass over the distinct words splits stop words from keyword candidates
+        stop_words = self.STOP_WORDS
+        word_freq = {}
+        stop_count = 0
+        for w, n in word_counts.items():
+            if w in stop_words:
+                stop_count += n
+            elif len(w) > 2:
+                word_freq[w] = n
+        result['top_keywords'] = heapq.nlargest(10, word_freq.items(), key=itemgetter(1))
+        
+        if word_freq:
             result['keyword_density'] = {word: round((count / len(words)) * 100, 2) 
-                                         for word, count in word_freq.most_common(5)}
+                                         for word, count in result['top_keywords'][:5]}
         
-        stop_count = sum(1 for w in words if w in self.STOP_WORDS)
         result['stop_words_ratio'] = round((stop_count / len(words)) * 100, 1) if words else 0
         
-        result['has_lists'] = len(soup_copy.find_all(['ul', 'ol'])) > 0
-        result['ordered_lists'] = len(soup_copy.find_all('ol'))
-        result['unordered_lists'] = len(soup_copy.find_all('ul'))
-        result['list_items'] = len(soup_copy.find_all('li'))
+        result['ordered_lists'] = count('ol')
+        result['unordered_lists'] = count('ul')
+        result['has_lists'] = result['ordered_lists'] + result['unordered_lists'] > 0
+        result['list_items'] = count('li')
         
-        result['has_tables'] = len(soup_copy.find_all('table')) > 0
-        result['table_count'] = len(soup_copy.find_all('table'))
-        result['tables_with_headers'] = len([t for t in soup_copy.find_all('table') if t.find('th')])
+        tables = [t for t in self._elements('table') if id(t) not in skip]
+        result['table_count'] = len(tables)
+        result['has_tables'] = result['table_count'] > 0
+        result['tables_with_headers'] = sum(
+            1 for t in tables if any(id(th) not in skip for th in t.find_all('th')))
         
-        result['has_blockquotes'] = len(soup_copy.find_all('blockquote')) > 0
-        result['blockquote_count'] = len(soup_copy.find_all('blockquote'))
+        result['blockquote_count'] = count('blockquote')
+        result['has_blockquotes'] = result['blockquote_count'] > 0
         
-        result['has_code_blocks'] = len(soup_copy.find_all(['code', 'pre'])) > 0
-        result['code_block_count'] = len(soup_copy.find_all('pre'))
+        result['code_block_count'] = count('pre')
+        result['has_code_blocks'] = result['code_block_count'] > 0 or count('code') > 0
         
-        result['bold_text_count'] = len(soup_copy.find_all(['b', 'strong']))
-        result['italic_text_count'] = len(soup_copy.find_all(['i', 'em']))
-        result['underline_text_count'] = len(soup_copy.find_all('u'))
-        result['highlighted_text'] = len(soup_copy.find_all('mark'))
+        result['bold_text_count'] = count('b', 'strong')
+        result['italic_text_count'] = count('i', 'em')
+        result['underline_text_count'] = count('u')
+        result['highlighted_text'] = count('mark')
         
-        result['video_count'] = len(self.soup.find_all('video'))
-        result['audio_count'] = len(self.soup.find_all('audio'))
-        result['iframe_count'] = len(self.soup.find_all('iframe'))
-        result['embed_count'] = len(self.soup.find_all('embed'))
-        result['object_count'] = len(self.soup.find_all('object'))
+        result['video_count'] = self._count('video')
+        result['audio_count'] = self._count('audio')
+        result['iframe_count'] = self._count('iframe')
+        result['embed_count'] = self._count('embed')
+        result['object_count'] = self._count('object')
         
         score = 100
         if result['word_count'] < 300:
@@ -1390,15 +1879,11 @@ class AdvancedSEOAuditor:
     
     def _count_syllables(self, word: str) -> int:
         word = word.lower()
-        count = 0
-        vowels = 'aeiouy'
-        prev_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_vowel:
-                count += 1
-            prev_vowel = is_vowel
+        # One byte lane per character (0x01 for a vowel); a syllable starts
+        # wherever a vowel lane is not preceded by another vowel lane.
+        lanes = word.encode('ascii', 'replace').translate(self._VOWEL_TABLE)
+        mask = int.from_bytes(lanes, 'little')
+        count = (mask & ~(mask << 8)).bit_count()
         
         if word.endswith('e'):
             count -= 1
@@ -1409,22 +1894,22 @@ class AdvancedSEOAuditor:
     def analyze_mobile_ux(self) -> dict:
         result = {}
         
-        viewport = self.soup.find('meta', attrs={'name': 'viewport'})
+        viewport = self._viewport
         result['is_mobile_friendly'] = viewport is not None
         
-        amp_link = self.soup.find('link', attrs={'rel': 'amphtml'})
+        amp_link = self._find_link('amphtml')
         result['has_amp_version'] = amp_link is not None
         result['amp_url'] = amp_link.get('href') if amp_link else None
         
-        touch_icons = self.soup.find_all('link', attrs={'rel': lambda x: x and 'apple-touch-icon' in x if x else False})
+        touch_icons = self._links_rel_containing('apple-touch-icon')
         result['touch_icons_count'] = len(touch_icons)
         
-        theme_color = self.soup.find('meta', attrs={'name': 'theme-color'})
+        theme_color = self._find_meta('name', 'theme-color')
         result['has_theme_color'] = theme_color is not None
         result['theme_color'] = theme_color.get('content') if theme_color else None
         
-        ios_app = self.soup.find('meta', attrs={'name': 'apple-itunes-app'})
-        android_app = self.soup.find('meta', attrs={'name': 'google-play-app'})
+        ios_app = self._find_meta('name', 'apple-itunes-app')
+        android_app = self._find_meta('name', 'google-play-app')
         result['has_mobile_app_links'] = ios_app is not None or android_app is not None
         result['ios_app_link'] = ios_app.get('content') if ios_app else None
         result['android_app_link'] = android_app.get('content') if android_app else None
@@ -1442,7 +1927,7 @@ class AdvancedSEOAuditor:
     def analyze_internationalization(self) -> dict:
         result = {}
         
-        hreflang_links = self.soup.find_all('link', attrs={'rel': 'alternate', 'hreflang': True})
+        hreflang_links = [link for link in self._links_with_rel('alternate') if link.has_attr('hreflang')]
         result['has_hreflang'] = len(hreflang_links) > 0
         result['hreflang_count'] = len(hreflang_links)
         result['hreflang_tags'] = [
@@ -1451,10 +1936,10 @@ class AdvancedSEOAuditor:
         ]
         result['has_x_default'] = any(link.get('hreflang') == 'x-default' for link in hreflang_links)
         
-        content_lang = self.soup.find('meta', attrs={'http-equiv': 'content-language'})
+        content_lang = self._find_meta('http-equiv', 'content-language')
         result['content_language'] = content_lang.get('content') if content_lang else None
         
-        html_tag = self.soup.find('html')
+        html_tag = self._first('html')
         result['detected_language'] = html_tag.get('lang') if html_tag else None
         
         result['has_direction_attr'] = html_tag.get('dir') is not None if html_tag else False
@@ -1472,32 +1957,23 @@ class AdvancedSEOAuditor:
     def analyze_social(self) -> dict:
         result = {}
         
-        links = self.soup.find_all('a', href=True)
+        links = self._anchors
         social_links = {}
         
+        social_domains = self._SOCIAL_DOMAINS
         for link in links:
             href = link.get('href', '').lower()
-            for platform, pattern in self.SOCIAL_PATTERNS.items():
-                if re.search(pattern, href):
+            for domain, platform in social_domains:
+                if domain in href:
                     social_links[platform] = href
                     break
         
         result['social_links'] = social_links
         result['social_links_count'] = len(social_links)
         
-        share_patterns = ['share', 'social-share', 'sharing', 'addthis', 'sharethis']
-        share_elements = []
-        for pattern in share_patterns:
-            share_elements.extend(self.soup.find_all(class_=lambda x: x and pattern in x.lower() if x else False))
-        result['has_share_buttons'] = len(share_elements) > 0
-        
-        review_patterns = ['review', 'testimonial', 'rating', 'stars']
-        has_social_proof = False
-        for pattern in review_patterns:
-            if self.soup.find(class_=lambda x: x and pattern in x.lower() if x else False):
-                has_social_proof = True
-                break
-        result['has_social_proof'] = has_social_proof
+        result['has_share_buttons'] = self._has_class(*self.SHARE_PATTERNS)
+        
+        result['has_social_proof'] = self._has_class(*self.REVIEW_PATTERNS)
         
         score = 100
         if result['social_links_count'] == 0:
@@ -1512,21 +1988,7 @@ class AdvancedSEOAuditor:
     def analyze_ecommerce(self) -> dict:
         result = {}
         
-        schema_scripts = self.soup.find_all('script', attrs={'type': 'application/ld+json'})
-        all_schemas = []
-        
-        for script in schema_scripts:
-            try:
-                if script.string:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        all_schemas.append(data)
-                        if '@graph' in data:
-                            all_schemas.extend(data['@graph'])
-                    elif isinstance(data, list):
-                        all_schemas.extend(data)
-            except:
-                pass
+        all_schemas = self._ld_json
         
         schema_types = [s.get('@type', '') for s in all_schemas if isinstance(s, dict)]
         
@@ -1542,21 +2004,20 @@ class AdvancedSEOAuditor:
         for schema in all_schemas:
             if isinstance(schema, dict) and schema.get('@type') == 'Product':
                 result['product_name'] = schema.get('name')
-                offers = schema.get('offers', {})
+                offers = schema.get('offers')
                 if isinstance(offers, dict):
                     result['product_price'] = offers.get('price')
                     result['product_currency'] = offers.get('priceCurrency')
                     result['product_availability'] = offers.get('availability')
-                rating = schema.get('aggregateRating', {})
+                rating = schema.get('aggregateRating')
                 if isinstance(rating, dict):
                     result['product_rating'] = rating.get('ratingValue')
                     result['product_review_count'] = rating.get('reviewCount')
                 break
         
-        breadcrumb_patterns = ['breadcrumb', 'bread-crumb', 'breadcrumbs']
         breadcrumb_el = None
-        for pattern in breadcrumb_patterns:
-            breadcrumb_el = self.soup.find(class_=lambda x: x and pattern in x.lower() if x else False)
+        for pattern in self.BREADCRUMB_PATTERNS:
+            breadcrumb_el = self._find_by_class(pattern)
             if breadcrumb_el:
                 break
         
@@ -1592,19 +2053,17 @@ class AdvancedSEOAuditor:
     def analyze_accessibility(self) -> dict:
         result = {}
         
-        skip_link = self.soup.find('a', href='#main') or self.soup.find('a', href='#content')
-        skip_link = skip_link or self.soup.find('a', class_=lambda x: x and 'skip' in x.lower() if x else False)
+        skip_link = (next((a for a in self._anchors if a['href'] == '#main'), None)
+                     or next((a for a in self._anchors if a['href'] == '#content'), None))
+        skip_link = skip_link or self._find_by_class('skip', name='a')
         result['has_skip_link'] = skip_link is not None
         
-        result['has_main_landmark'] = self.soup.find('main') is not None or \
-                                      self.soup.find(attrs={'role': 'main'}) is not None
-        result['has_nav_landmark'] = self.soup.find('nav') is not None or \
-                                     self.soup.find(attrs={'role': 'navigation'}) is not None
-        result['has_footer_landmark'] = self.soup.find('footer') is not None or \
-                                        self.soup.find(attrs={'role': 'contentinfo'}) is not None
+        result['has_main_landmark'] = self._first('main') is not None or self._has_role('main')
+        result['has_nav_landmark'] = self._first('nav') is not None or self._has_role('navigation')
+        result['has_footer_landmark'] = self._first('footer') is not None or self._has_role('contentinfo')
         
-        inputs = self.soup.find_all(['input', 'textarea', 'select'])
-        labels = self.soup.find_all('label')
+        inputs = self._elements('input', 'textarea', 'select')
+        labels = self._elements('label')
         
         result['form_inputs_count'] = len(inputs)
         result['form_labels_count'] = len(labels)
@@ -1619,16 +2078,16 @@ class AdvancedSEOAuditor:
         for inp in inputs:
             inp_id = inp.get('id')
             inp_type = inp.get('type', '').lower()
-            if inp_type not in ['hidden', 'submit', 'button', 'reset']:
+            if inp_type not in self.NON_LABELABLE_INPUTS:
                 if not inp_id or inp_id not in labeled_inputs:
                     if not inp.get('aria-label') and not inp.get('aria-labelledby'):
                         unlabeled += 1
         
         result['forms_without_labels'] = unlabeled
         
-        result['aria_labels_count'] = len(self.soup.find_all(attrs={'aria-label': True}))
-        result['aria_roles_count'] = len(self.soup.find_all(attrs={'role': True}))
-        result['tabindex_elements'] = len(self.soup.find_all(attrs={'tabindex': True}))
+        result['aria_labels_count'] = len(self._dom_index['aria-label'])
+        result['aria_roles_count'] = len(self._dom_index['role'])
+        result['tabindex_elements'] = len(self._dom_index['tabindex'])
         
         score = 100
         if not result['has_main_landmark']:
@@ -1649,19 +2108,19 @@ class AdvancedSEOAuditor:
     def analyze_performance_hints(self) -> dict:
         result = {}
         
-        preload_links = self.soup.find_all('link', attrs={'rel': 'preload'})
+        preload_links = self._links_with_rel('preload')
         result['has_preload'] = len(preload_links) > 0
         result['preload_resources'] = [link.get('href') for link in preload_links]
         
-        prefetch_links = self.soup.find_all('link', attrs={'rel': 'prefetch'})
+        prefetch_links = self._links_with_rel('prefetch')
         result['has_prefetch'] = len(prefetch_links) > 0
         result['prefetch_resources'] = [link.get('href') for link in prefetch_links]
         
-        preconnect_links = self.soup.find_all('link', attrs={'rel': 'preconnect'})
+        preconnect_links = self._links_with_rel('preconnect')
         result['has_preconnect'] = len(preconnect_links) > 0
         result['preconnect_domains'] = [link.get('href') for link in preconnect_links]
         
-        dns_prefetch = self.soup.find_all('link', attrs={'rel': 'dns-prefetch'})
+        dns_prefetch = self._links_with_rel('dns-prefetch')
         result['has_dns_prefetch'] = len(dns_prefetch) > 0
         
         result['has_resource_hints'] = any([
@@ -1693,7 +2152,7 @@ class AdvancedSEOAuditor:
         result = {}
         
         # Check if URL is indexable
-        robots_meta = self.soup.find('meta', attrs={'name': 'robots'})
+        robots_meta = self._find_meta('name', 'robots')
         robots_content = robots_meta.get('content', '').lower() if robots_meta else ''
         
         # X-Robots-Tag header
@@ -1708,7 +2167,7 @@ class AdvancedSEOAuditor:
             self.issues["passed"].append("Page is indexable")
         
         # URL structure analysis
-        parsed = urlparse(self.url)
+        parsed = self._parsed_url
         result['url_length'] = len(self.url)
         result['url_has_parameters'] = bool(parsed.query)
         result['url_has_underscores'] = '_' in parsed.path
@@ -1745,9 +2204,8 @@ class AdvancedSEOAuditor:
             self.issues["critical"].append(f"Server error: {self.response.status_code}")
         
         # Check system pages that should be noindexed
-        system_patterns = ['/search', '/cart', '/checkout', '/login', '/register', '/account', '/wishlist']
         current_path = parsed.path.lower()
-        is_system_page = any(pattern in current_path for pattern in system_patterns)
+        is_system_page = any(pattern in current_path for pattern in self.SYSTEM_PATH_PATTERNS)
         
         if is_system_page and result['is_indexable']:
             self.issues["warnings"].append("System page (search/cart/login) should have noindex directive")
@@ -1775,21 +2233,37 @@ class AdvancedSEOAuditor:
         result = {}
         
         # Check for thin content
-        text = self.soup.get_text(separator=' ')
-        word_count = len(re.findall(r'\b[a-zA-Z]+\b', text))
+        # Only the first 300 words matter unless the full list is already cached
+        if '_word_list' in self.__dict__:
+            word_count = len(self._word_list)
+        else:
+            word_count = sum(1 for _ in islice(_WORD_RE.finditer(self._full_text_lower), 300))
         result['has_thin_content'] = word_count < 300
         
         if result['has_thin_content']:
             self.issues["warnings"].append(f"Thin content detected ({word_count} words). Aim for 300+ words for quality content.")
         
         # Check for privacy policy, contact, about pages (via links)
-        all_links = self.soup.find_all('a', href=True)
-        link_hrefs = [a.get('href', '').lower() for a in all_links]
-        link_texts = [a.get_text().lower() for a in all_links]
+        found = {'privacy': False, 'contact': False, 'about': False}
+        for a in self._anchors:
+            href = a.get('href', '').lower()
+            text = None
+            for page in found:
+                if found[page]:
+                    continue
+                if page in href:
+                    found[page] = True
+                    continue
+                if text is None:
+                    text = a.get_text().lower()
+                if page in text:
+                    found[page] = True
+            if all(found.values()):
+                break
         
-        result['has_privacy_policy'] = any('privacy' in h or 'privacy' in t for h, t in zip(link_hrefs, link_texts))
-        result['has_contact_page'] = any('contact' in h or 'contact' in t for h, t in zip(link_hrefs, link_texts))
-        result['has_about_page'] = any('about' in h or 'about' in t for h, t in zip(link_hrefs, link_texts))
+        result['has_privacy_policy'] = found['privacy']
+        result['has_contact_page'] = found['contact']
+        result['has_about_page'] = found['about']
         
         if not result['has_privacy_policy']:
             self.issues["recommendations"].append("Add a Privacy Policy page and link to it")
@@ -1802,7 +2276,7 @@ class AdvancedSEOAuditor:
             self.issues["passed"].append("Contact page link found")
         
         # Check for publication/modified dates
-        time_elements = self.soup.find_all(['time', 'meta'])
+        time_elements = self._dom_index['time_meta']
         for el in time_elements:
             if el.name == 'time':
                 datetime_attr = el.get('datetime')
@@ -1816,22 +2290,11 @@ class AdvancedSEOAuditor:
                     result['modified_date'] = el.get('content')
         
         # Check for author info
-        author_meta = self.soup.find('meta', attrs={'name': 'author'})
+        author_meta = self._find_meta('name', 'author')
         author_schema = None
-        schema_scripts = self.soup.find_all('script', attrs={'type': 'application/ld+json'})
-        for script in schema_scripts:
-            try:
-                if script.string:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        if data.get('@type') == 'Article' and 'author' in data:
-                            author_schema = data['author']
-                        elif '@graph' in data:
-                            for item in data['@graph']:
-                                if item.get('@type') == 'Article' and 'author' in item:
-                                    author_schema = item['author']
-            except:
-                pass
+        for schema in self._ld_json:
+            if isinstance(schema, dict) and schema.get('@type') == 'Article' and 'author' in schema:
+                author_schema = schema['author']
         
         result['has_author_info'] = author_meta is not None or author_schema is not None
         if author_meta:
@@ -1848,7 +2311,7 @@ class AdvancedSEOAuditor:
             self.issues["recommendations"].append("Add author information for better E-E-A-T signals")
         
         # Check for content in iframes
-        iframes = self.soup.find_all('iframe')
+        iframes = self._elements('iframe')
         main_content_iframes = [iframe for iframe in iframes if not iframe.get('src', '').startswith('https://www.youtube') 
                                 and not iframe.get('src', '').startswith('https://www.google.com/maps')]
         result['content_in_iframes'] = len(main_content_iframes) > 0
@@ -1857,40 +2320,31 @@ class AdvancedSEOAuditor:
             self.issues["warnings"].append("Important content may be inside iframes - not easily crawlable")
         
         # Check for intrusive interstitials
-        popup_patterns = ['modal', 'popup', 'overlay', 'interstitial', 'lightbox']
-        result['has_intrusive_interstitials'] = any(
-            self.soup.find(class_=lambda x: x and pattern in x.lower() if x else False)
-            for pattern in popup_patterns
-        )
+        result['has_intrusive_interstitials'] = self._has_class(*self.POPUP_PATTERNS)
         
         # Check for heavy above-the-fold ads
-        ad_patterns = ['advertisement', 'ad-slot', 'ad-container', 'adsense', 'ad-banner']
-        ads_above_fold = sum(1 for pattern in ad_patterns if 
-                           self.soup.find(class_=lambda x: x and pattern in x.lower() if x else False))
+        ads_above_fold = sum(1 for pattern in self.AD_PATTERNS if self._has_class(pattern))
         result['has_heavy_above_fold_ads'] = ads_above_fold > 2
-        result['ad_density_ratio'] = ads_above_fold / max(1, len(self.soup.find_all(['div', 'section']))) * 100
+        result['ad_density_ratio'] = ads_above_fold / max(1, self._count('div', 'section')) * 100
         
         if result['has_heavy_above_fold_ads']:
             self.issues["warnings"].append("Heavy ad density detected - may impact user experience and rankings")
         
         # Check for hidden text (common spam technique)
-        hidden_patterns = ['display:none', 'visibility:hidden', 'font-size:0', 'color:white']
         potential_hidden = []
-        for element in self.soup.find_all(style=True):
-            style = element.get('style', '').lower().replace(' ', '')
-            if any(pattern.replace(' ', '') in style for pattern in hidden_patterns):
-                if element.get_text().strip():
-                    potential_hidden.append(element.get_text()[:50])
+        for element, style in self._compact_styles:
+            if any(pattern in style for pattern in self.HIDDEN_STYLE_PATTERNS):
+                hidden_text = element.get_text()
+                if hidden_text.strip():
+                    potential_hidden.append(hidden_text[:50])
         
         result['has_hidden_text'] = len(potential_hidden) > 0
         if result['has_hidden_text']:
             self.issues["critical"].append("Hidden text detected - this is against Google guidelines")
         
         # Check for clear CTAs
-        cta_patterns = ['buy now', 'sign up', 'get started', 'learn more', 'contact us', 
-                       'subscribe', 'download', 'shop now', 'order now', 'add to cart']
-        all_text = text.lower()
-        result['has_clear_cta'] = any(cta in all_text for cta in cta_patterns)
+        all_text = self._full_text_lower
+        result['has_clear_cta'] = any(cta in all_text for cta in self.CTA_PHRASES)
         
         if result['has_clear_cta']:
             self.issues["passed"].append("Clear call-to-action found")
@@ -1898,8 +2352,7 @@ class AdvancedSEOAuditor:
             self.issues["recommendations"].append("Add clear calls-to-action to improve conversions")
         
         # Check for semantic HTML
-        semantic_elements = ['header', 'nav', 'main', 'article', 'section', 'aside', 'footer']
-        semantic_count = sum(len(self.soup.find_all(el)) for el in semantic_elements)
+        semantic_count = self._count(*self.SEMANTIC_ELEMENTS)
         result['uses_semantic_html'] = semantic_count >= 3
         
         if result['uses_semantic_html']:
@@ -1913,7 +2366,7 @@ class AdvancedSEOAuditor:
             result.get('has_about_page', False),
             result.get('has_contact_page', False),
             bool(result.get('publication_date')),
-            self.soup.find('meta', attrs={'name': 'author'}) is not None
+            self._find_meta('name', 'author') is not None
         ]
         result['has_eeat_signals'] = sum(eeat_signals) >= 3
         
@@ -1956,10 +2409,10 @@ class AdvancedSEOAuditor:
             result['score'] = 50  # Neutral score if no keyword set
             return result
         
-        keyword = self.target_keyword.lower()
+        keyword = self.target_keyword
         
         # Title analysis
-        title_tag = self.soup.find('title')
+        title_tag = self._first('title')
         if title_tag:
             title_text = title_tag.get_text().lower()
             result['keyword_in_title'] = keyword in title_text
@@ -1973,7 +2426,7 @@ class AdvancedSEOAuditor:
                 self.issues["recommendations"].append(f"Add target keyword '{self.target_keyword}' to the title")
         
         # Meta description analysis
-        meta_desc = self.soup.find('meta', attrs={'name': 'description'})
+        meta_desc = self._meta_description
         if meta_desc:
             desc_text = meta_desc.get('content', '').lower()
             result['keyword_in_meta_desc'] = keyword in desc_text
@@ -1983,9 +2436,9 @@ class AdvancedSEOAuditor:
                 self.issues["recommendations"].append("Add target keyword to meta description for better CTR")
         
         # H1 analysis
-        h1_tags = self.soup.find_all('h1')
-        for h1 in h1_tags:
-            if keyword in h1.get_text().lower():
+        h1_tags = self._elements('h1')
+        for h1_text in self._heading_texts['h1']:
+            if keyword in h1_text.lower():
                 result['keyword_in_h1'] = True
                 self.issues["passed"].append("Target keyword found in H1")
                 break
@@ -1994,9 +2447,9 @@ class AdvancedSEOAuditor:
             self.issues["recommendations"].append("Include target keyword in the H1 heading")
         
         # H2 analysis
-        h2_tags = self.soup.find_all('h2')
-        for h2 in h2_tags:
-            if keyword in h2.get_text().lower():
+        h2_tags = self._elements('h2')
+        for h2_text in self._heading_texts['h2']:
+            if keyword in h2_text.lower():
                 result['keyword_in_h2'] = True
                 self.issues["passed"].append("Target keyword found in H2 subheading")
                 break
@@ -2005,14 +2458,12 @@ class AdvancedSEOAuditor:
             self.issues["recommendations"].append("Include target keyword (or close variant) in an H2 subheading")
         
         # Body content analysis
-        body_text = self.soup.get_text().lower()
-        words = re.findall(r'\b[a-zA-Z]+\b', body_text)
+        body_text = self._keyword_text_lower
+        words = _WORD_RE.findall(body_text)
         total_words = len(words)
         
         # Count keyword occurrences
-        keyword_pattern = re.escape(keyword)
-        keyword_matches = re.findall(keyword_pattern, body_text)
-        result['keyword_count_in_body'] = len(keyword_matches)
+        result['keyword_count_in_body'] = body_text.count(keyword)
         result['keyword_in_body'] = result['keyword_count_in_body'] > 0
         
         if total_words > 0:
@@ -2029,7 +2480,7 @@ class AdvancedSEOAuditor:
             self.issues["passed"].append(f"Keyword density is optimal ({result['keyword_density_percent']}%)")
         
         # First paragraph check
-        paragraphs = self.soup.find_all('p')
+        paragraphs = self._elements('p')
         if paragraphs:
             first_para = paragraphs[0].get_text().lower() if paragraphs else ''
             result['keyword_in_first_paragraph'] = keyword in first_para
@@ -2067,7 +2518,7 @@ class AdvancedSEOAuditor:
         result = {}
         
         # Page weight
-        page_size_kb = len(self.response.content) / 1024
+        page_size_kb = self._html_bytes_len / 1024
         result['mobile_page_weight_kb'] = round(page_size_kb, 2)
         result['mobile_page_heavy'] = page_size_kb > 1500  # 1.5MB threshold for mobile
         
@@ -2075,7 +2526,7 @@ class AdvancedSEOAuditor:
             self.issues["warnings"].append(f"Page is heavy for mobile ({result['mobile_page_weight_kb']}KB). Aim for under 1.5MB.")
         
         # Responsive images check
-        images = self.soup.find_all('img')
+        images = self._elements('img')
         images_with_srcset = sum(1 for img in images if img.get('srcset'))
         result['has_responsive_images'] = images_with_srcset > len(images) * 0.5 if images else True
         
@@ -2088,9 +2539,9 @@ class AdvancedSEOAuditor:
         
         # Font size check (look for very small font sizes in styles)
         small_fonts = 0
-        for element in self.soup.find_all(style=True):
+        for element in self._dom_index['styled']:
             style = element.get('style', '')
-            font_match = re.search(r'font-size:\s*(\d+)', style)
+            font_match = _FONT_SIZE_RE.search(style)
             if font_match and int(font_match.group(1)) < 12:
                 small_fonts += 1
         
@@ -2103,12 +2554,13 @@ class AdvancedSEOAuditor:
             self.issues["passed"].append("Font sizes appear readable")
         
         # Tap target analysis (buttons, links should be adequately sized)
-        links = self.soup.find_all('a')
+        links = self._elements('a')
         tap_issues = 0
+        image_anchors = self._image_anchor_ids
         for link in links:
             # Check if link has very short text (potential tap target issue)
             text = link.get_text().strip()
-            if text and len(text) < 3 and not link.find('img'):
+            if text and len(text) < 3 and id(link) not in image_anchors:
                 tap_issues += 1
         
         result['tap_targets_sized_correctly'] = tap_issues < 5
@@ -2118,19 +2570,17 @@ class AdvancedSEOAuditor:
             self.issues["warnings"].append(f"{tap_issues} potential tap target issues. Ensure clickable elements are adequately sized.")
         
         # Viewport meta check
-        viewport = self.soup.find('meta', attrs={'name': 'viewport'})
+        viewport = self._viewport
         result['content_width_fits_viewport'] = viewport is not None
         
         # Mobile navigation check
-        nav = self.soup.find('nav') or self.soup.find(class_=lambda x: x and 'nav' in x.lower() if x else False)
-        hamburger_patterns = ['hamburger', 'mobile-menu', 'menu-toggle', 'nav-toggle']
-        has_mobile_nav = any(self.soup.find(class_=lambda x: x and pattern in x.lower() if x else False) 
-                           for pattern in hamburger_patterns)
+        nav = self._first('nav') or self._find_by_class('nav')
+        has_mobile_nav = self._has_class(*self.HAMBURGER_PATTERNS)
         result['mobile_navigation_friendly'] = nav is not None
         result['thumb_friendly_navigation'] = has_mobile_nav or nav is not None
         
         # Favicon in mobile SERPs (check for proper favicon setup)
-        favicon = self.soup.find('link', attrs={'rel': lambda x: x and 'icon' in x.lower() if x else False})
+        favicon = (self._links_rel_containing('icon') or [None])[0]
         result['favicon_in_mobile_serps'] = favicon is not None
         
         # Mobile-desktop parity checks
@@ -2162,52 +2612,48 @@ class AdvancedSEOAuditor:
         result = {}
         
         # Multiple H1 check
-        h1_tags = self.soup.find_all('h1')
+        h1_tags = self._elements('h1')
         result['has_multiple_h1'] = len(h1_tags) > 1
         
         if result['has_multiple_h1']:
             self.issues["warnings"].append(f"Multiple H1 tags found ({len(h1_tags)}). Use only one H1 per page.")
         
         # Title matches content check
-        title_tag = self.soup.find('title')
-        h1_text = h1_tags[0].get_text().lower() if h1_tags else ''
+        title_tag = self._first('title')
+        h1_text = self._heading_texts['h1'][0].lower() if h1_tags else ''
         title_text = title_tag.get_text().lower() if title_tag else ''
         
         # Simple check: title and H1 should share some keywords
-        title_words = set(re.findall(r'\b\w+\b', title_text))
-        h1_words = set(re.findall(r'\b\w+\b', h1_text))
-        common_words = title_words & h1_words - {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
+        title_words = set(_TOKEN_RE.findall(title_text))
+        h1_words = set(_TOKEN_RE.findall(h1_text))
+        common_words = title_words & h1_words - self.TITLE_FILLER_WORDS
         result['title_matches_content'] = len(common_words) >= 2 if title_words and h1_words else True
         
         if not result['title_matches_content']:
             self.issues["recommendations"].append("Title and H1 should be related - ensure they describe the same topic")
         
         # Meta description uniqueness (basic check - just verify it's not a duplicate of title)
-        meta_desc = self.soup.find('meta', attrs={'name': 'description'})
+        meta_desc = self._meta_description
         desc_text = meta_desc.get('content', '') if meta_desc else ''
-        result['meta_desc_is_unique'] = desc_text.lower() != title_text and len(desc_text) > 0
+        desc_lower = desc_text.lower()
+        result['meta_desc_is_unique'] = desc_lower != title_text and len(desc_text) > 0
         
         if not result['meta_desc_is_unique'] and desc_text:
             self.issues["warnings"].append("Meta description should be unique and not duplicate the title")
         
         # Check if meta description is compelling (has power words or CTA)
-        compelling_words = ['discover', 'learn', 'get', 'find', 'best', 'top', 'ultimate', 'free', 'easy', 'proven', 'exclusive']
-        result['meta_desc_compelling'] = any(word in desc_text.lower() for word in compelling_words)
+        result['meta_desc_compelling'] = bool(desc_lower) and any(word in desc_lower for word in self.COMPELLING_WORDS)
         
         if not result['meta_desc_compelling'] and desc_text:
             self.issues["recommendations"].append("Make meta description more compelling with action words or unique value proposition")
         
         # Links distinguishable check
-        links = self.soup.find_all('a')
-        styled_links = sum(1 for link in links if link.get('style') or link.get('class'))
         result['links_distinguishable'] = True  # Assume true; proper check requires CSS parsing
         
         # Text contrast check (basic - look for potential issues)
-        low_contrast_patterns = ['color:#fff', 'color:white', 'color:#ccc', 'color:#ddd']
         contrast_issues = 0
-        for element in self.soup.find_all(style=True):
-            style = element.get('style', '').lower().replace(' ', '')
-            if any(pattern.replace(' ', '') in style for pattern in low_contrast_patterns):
+        for _, style in self._compact_styles:
+            if any(pattern in style for pattern in self.LOW_CONTRAST_PATTERNS):
                 contrast_issues += 1
         result['text_contrast_sufficient'] = contrast_issues < 3
         
@@ -2215,7 +2661,7 @@ class AdvancedSEOAuditor:
             self.issues["warnings"].append("Potential text contrast issues detected. Ensure sufficient contrast for readability.")
         
         # Primary content clear check
-        main_element = self.soup.find('main') or self.soup.find('article')
+        main_element = self._first('main') or self._first('article')
         result['primary_content_clear'] = main_element is not None
         
         if result['primary_content_clear']:
@@ -2224,7 +2670,7 @@ class AdvancedSEOAuditor:
             self.issues["recommendations"].append("Use <main> or <article> tags to clearly mark primary content")
         
         # Supplementary content marked
-        aside_elements = self.soup.find_all('aside')
+        aside_elements = self._elements('aside')
         result['supplementary_content_marked'] = len(aside_elements) > 0
         
         # Score calculation
@@ -2244,138 +2690,190 @@ class AdvancedSEOAuditor:
         
         return result
     
+    @staticmethod
+    def _meta_category_score(critical: List[str]) -> int:
+        """Meta category score: 100 minus 20 per critical issue about the title or meta tags"""
+        return 100 - sum(20 for i in critical if 'title' in i.lower() or 'meta' in i.lower())
+    
+    def _category_scores(self, category_data: dict) -> dict:
+        """Per-category scores from analyzer results keyed by category, for calculate_score"""
+        category_scores = {'meta': self._meta_category_score(self.issues["critical"])}
+        headings_data = category_data.get('headings')
+        if headings_data is not None:
+            category_scores['headings'] = 100 if headings_data['h1_count'] == 1 else 60
+        for category, key in self._CATEGORY_SCORE_KEYS.items():
+            if category in category_data:
+                category_scores[category] = category_data[category].get(key, 50)
+        return category_scores
+    
     def calculate_score(self, category_scores: dict) -> Tuple[int, str]:
-        weights = {
-            'meta': 15,
-            'headings': 10,
-            'images': 10,
-            'links': 10,
-            'technical': 20,
-            'content': 15,
-            'mobile_ux': 10,
-            'social': 5,
-            'ecommerce': 5
-        }
-        
-        total_score = 0
-        total_weight = sum(weights.values())
-        
-        for category, weight in weights.items():
-            score = category_scores.get(category, 50)
-            total_score += (score * weight)
+        total_score = sum(category_scores.get(category, 50) * weight
+                          for category, weight in self.SCORE_WEIGHTS.items())
+        final_score = int(total_score / self._SCORE_WEIGHT_TOTAL)
         
-        final_score = int(total_score / total_weight)
-        
-        final_score -= len(self.issues["critical"]) * 5
-        final_score -= len(self.issues["warnings"]) * 1
+        issues = self.issues
+        final_score -= len(issues["critical"]) * 5
+        final_score -= len(issues["warnings"]) * 1
         
         final_score = max(0, min(100, final_score))
         
-        if final_score >= 90:
-            grade = "A+"
-        elif final_score >= 80:
-            grade = "A"
-        elif final_score >= 70:
-            grade = "B"
-        elif final_score >= 60:
-            grade = "C"
-        elif final_score >= 50:
-            grade = "D"
-        else:
-            grade = "F"
+        grade = self._GRADE_BY_TENS[final_score // 10]
         
         return final_score, grade
     
-    def run_audit(self, use_existing_fetch: bool = False) -> Optional[SEOAuditResult]:
-        print(f"\n🔍 Starting Advanced SEO Audit for: {self.url}")
-        print("=" * 60)
-        print("Analyzing 200+ SEO parameters...")
-        
+    def _prepare_audit(self, use_existing_fetch: bool) -> bool:
         # Reset issues to ensure fresh state
         self.issues = {"critical": [], "warnings": [], "recommendations": [], "passed": []}
+        self._reset_page_cache()
         
-        if not use_existing_fetch:
-            if not self.fetch_page():
-                return None
-        else:
-            if self.soup is None or self.response is None:
-                if not self.fetch_page():
-                    return None
-        
-        print("  ✓ Analyzing meta tags...")
-        title_data = self.analyze_title()
-        meta_desc_data = self.analyze_meta_description()
-        meta_data = self.analyze_meta_tags()
-        
-        print("  ✓ Analyzing Open Graph & Twitter Cards...")
-        og_data = self.analyze_open_graph()
-        twitter_data = self.analyze_twitter_cards()
-        
-        print("  ✓ Analyzing headings...")
-        headings_data = self.analyze_headings()
-        
-        print("  ✓ Analyzing images...")
-        images_data = self.analyze_images()
-        
-        print("  ✓ Analyzing links...")
-        links_data = self.analyze_links()
-        
-        print("  ✓ Analyzing technical SEO...")
-        technical_data = self.analyze_technical()
-        
-        print("  ✓ Analyzing content...")
-        content_data = self.analyze_content()
-        
-        print("  ✓ Analyzing mobile & UX...")
-        mobile_data = self.analyze_mobile_ux()
-        
-        print("  ✓ Analyzing internationalization...")
-        i18n_data = self.analyze_internationalization()
-        
-        print("  ✓ Analyzing social integration...")
-        social_data = self.analyze_social()
-        
-        print("  ✓ Analyzing e-commerce & rich snippets...")
-        ecommerce_data = self.analyze_ecommerce()
-        
-        print("  ✓ Analyzing accessibility...")
-        accessibility_data = self.analyze_accessibility()
-        
-        print("  ✓ Analyzing performance hints...")
-        performance_data = self.analyze_performance_hints()
-        
-        print("  ✓ Analyzing crawling & indexing...")
-        crawling_data = self.analyze_crawling_indexing()
-        
-        print("  ✓ Analyzing content quality...")
-        content_quality_data = self.analyze_content_quality()
-        
-        print("  ✓ Analyzing keyword optimization...")
-        keyword_data = self.analyze_keyword_optimization()
+        if not use_existing_fetch or self.soup is None or self.response is None:
+            return self.fetch_page()
+        return True
+    
+    def quick_audit(self, use_existing_fetch: bool = False) -> Optional[QuickAuditResult]:
+        """Estimate the score from the title, meta description, headings and technical checks
         
-        print("  ✓ Analyzing mobile advanced features...")
-        mobile_advanced_data = self.analyze_mobile_advanced()
+        The other categories count as 50 and only these analyzers' issues
+        are penalised, so score and grade are an estimate and can differ
+        from run_audit's for the same page.
+        """
+        self._log(f"\n⚡ Quick SEO Audit for: {self.url}")
         
-        print("  ✓ Analyzing page elements...")
-        page_elements_data = self.analyze_page_elements()
+        if not self._prepare_audit(use_existing_fetch):
+            return None
         
-        category_scores = {
-            'meta': 100 - (len([i for i in self.issues["critical"] if 'title' in i.lower() or 'meta' in i.lower()]) * 20),
-            'headings': 100 if headings_data['h1_count'] == 1 else 60,
-            'images': images_data.get('score', 50),
-            'links': links_data.get('score', 50),
-            'technical': technical_data.get('security_headers_score', 50),
-            'content': content_data.get('score', 50),
-            'mobile_ux': mobile_data.get('score', 50),
-            'social': social_data.get('score', 50),
-            'ecommerce': ecommerce_data.get('score', 50),
-            'crawling': crawling_data.get('score', 50),
-            'content_quality': content_quality_data.get('score', 50),
-            'keyword': keyword_data.get('score', 50),
-            'mobile_advanced': mobile_advanced_data.get('score', 50),
-            'page_elements': page_elements_data.get('score', 50)
-        }
+        self.analyze_title()
+        self.analyze_meta_description()
+        score, grade = self.calculate_score(self._category_scores({
+            'headings': self.analyze_headings(),
+            'technical': self.analyze_technical(),
+        }))
+        issues = self.issues
         
+        return QuickAuditResult(
+            url=self.url,
+            audit_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            score=score,
+            grade=grade,
+            critical_issues=issues["critical"],
+            warnings=issues["warnings"],
+        )
+    
+    # Response headers that change on every request and do not affect the audit
+    _VOLATILE_HEADERS = frozenset({'date', 'age', 'expires', 'set-cookie', 'last-modified',
+                                   'x-request-id', 'cf-ray', 'report-to', 'nel'})
+    # Headers of a 304 that describe its (empty) body, not the stored page
+    _BODY_HEADERS = frozenset({'content-length', 'content-encoding', 'content-type', 'transfer-encoding'})
+    # Part of every result cache key; bump whenever analyzer or scoring changes alter results
+    _RESULT_CACHE_VERSION = 1
+    # Result fields drawn from a small fixed set of strings
+    _INTERNED_FIELDS = ('grade', 'title_status', 'meta_description_status',
+                        'heading_structure_status', 'readability_status')
+    
+    def _result_cache_path(self) -> Optional[str]:
+        """Cache file for the fetched page, keyed by cache version, URL, keyword, headers and body"""
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha256()
+        digest.update(f"{self._RESULT_CACHE_VERSION}|{self.url}|{self.target_keyword or ''}|"
+                      f"{self.response.status_code}|".encode('utf-8'))
+        for name, value in sorted((k.lower(), v) for k, v in self.headers.items()):
+            if name not in self._VOLATILE_HEADERS:
+                digest.update(f"{name}:{value}\n".encode('utf-8'))
+        digest.update(self._page_body)
+        return os.path.join(self.cache_dir, f"{digest.hexdigest()}.json")
+    
+    def _load_cached_result(self, path: str) -> Optional[SEOAuditResult]:
+        try:
+            with open(path, 'rb') as f:
+                data = _json_loads(f.read())
+            # JSON has no tuples; restore the (word, count) pairs
+            data['top_keywords'] = [tuple(pair) for pair in data.get('top_keywords', [])]
+            # Share one string per status value with freshly audited results
+            for name in self._INTERNED_FIELDS:
+                if isinstance(data.get(name), str):
+                    data[name] = sys.intern(data[name])
+            cached = SEOAuditResult(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        self.issues = {"critical": cached.critical_issues, "warnings": cached.warnings,
+                       "recommendations": cached.recommendations, "passed": cached.passed_checks}
+        return replace(cached, audit_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                       response_time=self.response_time,
+                       domain_slug=self._parsed_url.netloc.replace('.', '_'))
+    
+    def _store_cached_result(self, path: str, result: SEOAuditResult):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Missing keys come back as their defaults when the result is loaded
+            _write_atomic(path, _result_json(result, skip_defaults=True))
+        except OSError as e:
+            self._log(f"  ✗ Could not cache audit result: {e}")
+    
+    def run_audit(self, use_existing_fetch: bool = False) -> Optional[SEOAuditResult]:
+        self._log(f"\n🔍 Starting Advanced SEO Audit for: {self.url}\n"
+                  f"{'=' * 60}\n"
+                  "Analyzing 200+ SEO parameters...")
+        
+        if not self._prepare_audit(use_existing_fetch):
+            return None
+        
+        cache_path = self._result_cache_path()
+        if cache_path and os.path.exists(cache_path):
+            cached = self._load_cached_result(cache_path)
+            if cached is not None:
+                self._log(f"  ✓ Page unchanged since last audit, using cached result\n"
+                          f"\n✅ Audit complete! Score: {cached.score}/100 (Grade: {cached.grade})")
+                return cached
+        
+        (title_data, meta_desc_data, meta_data, og_data,
+         twitter_data, headings_data, images_data, links_data,
+         technical_data, content_data, mobile_data, i18n_data,
+         social_data, ecommerce_data, accessibility_data, performance_data,
+         crawling_data, content_quality_data, keyword_data, mobile_advanced_data,
+         page_elements_data) = self._run_analyzers([
+            ("Analyzing meta tags...", self.analyze_title),
+            (None, self.analyze_meta_description),
+            (None, self.analyze_meta_tags),
+            ("Analyzing Open Graph & Twitter Cards...", self.analyze_open_graph),
+            (None, self.analyze_twitter_cards),
+            ("Analyzing headings...", self.analyze_headings),
+            ("Analyzing images...", self.analyze_images),
+            ("Analyzing links...", self.analyze_links),
+            ("Analyzing technical SEO...", self.analyze_technical),
+            ("Analyzing content...", self.analyze_content),
+            ("Analyzing mobile & UX...", self.analyze_mobile_ux),
+            ("Analyzing internationalization...", self.analyze_internationalization),
+            ("Analyzing social integration...", self.analyze_social),
+            ("Analyzing e-commerce & rich snippets...", self.analyze_ecommerce),
+            ("Analyzing accessibility...", self.analyze_accessibility),
+            ("Analyzing performance hints...", self.analyze_performance_hints),
+            ("Analyzing crawling & indexing...", self.analyze_crawling_indexing),
+            ("Analyzing content quality...", self.analyze_content_quality),
+            ("Analyzing keyword optimization...", self.analyze_keyword_optimization),
+            ("Analyzing mobile advanced features...", self.analyze_mobile_advanced),
+            ("Analyzing page elements...", self.analyze_page_elements),
+        ])
+        issues = self.issues
+        critical = issues["critical"]
+        warnings = issues["warnings"]
+        passed = issues["passed"]
+        
+        category_scores = self._category_scores({
+            'headings': headings_data,
+            'images': images_data,
+            'links': links_data,
+            'technical': technical_data,
+            'content': content_data,
+            'mobile_ux': mobile_data,
+            'social': social_data,
+            'ecommerce': ecommerce_data,
+            'crawling': crawling_data,
+            'content_quality': content_quality_data,
+            'keyword': keyword_data,
+            'mobile_advanced': mobile_advanced_data,
+            'page_elements': page_elements_data,
+        })
         score, grade = self.calculate_score(category_scores)
         
         result = SEOAuditResult(
@@ -2383,6 +2881,7 @@ class AdvancedSEOAuditor:
             audit_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             score=score,
             grade=grade,
+            domain_slug=self._parsed_url.netloc.replace('.', '_'),
             
             title=title_data["title"],
             title_length=title_data["length"],
@@ -2745,27 +3244,23 @@ class AdvancedSEOAuditor:
             supplementary_content_marked=page_elements_data.get("supplementary_content_marked", False),
             page_elements_score=page_elements_data.get("score", 0),
             
-            critical_issues=self.issues["critical"],
-            warnings=self.issues["warnings"],
-            recommendations=self.issues["recommendations"],
-            passed_checks=self.issues["passed"],
+            critical_issues=critical,
+            warnings=warnings,
+            recommendations=issues["recommendations"],
+            passed_checks=passed,
             
-            meta_score=category_scores.get('meta', 0),
-            heading_score=category_scores.get('headings', 0),
-            technical_score=category_scores.get('technical', 0),
-            meta_tags_score=category_scores.get('meta', 0),
-            headings_score=category_scores.get('headings', 0),
-            technical_seo_score=category_scores.get('technical', 0),
-            
-            checks_passed=len(self.issues["passed"]),
-            checks_failed=len(self.issues["critical"]),
-            checks_warnings=len(self.issues["warnings"])
+            meta_score=category_scores['meta'],
+            heading_score=category_scores['headings'],
+            technical_score=category_scores['technical']
         )
         
-        print(f"\n✅ Audit complete! Score: {score}/100 (Grade: {grade})")
-        print(f"   Critical Issues: {len(self.issues['critical'])}")
-        print(f"   Warnings: {len(self.issues['warnings'])}")
-        print(f"   Passed Checks: {len(self.issues['passed'])}")
+        self._log(f"\n✅ Audit complete! Score: {score}/100 (Grade: {grade})\n"
+                  f"   Critical Issues: {len(critical)}\n"
+                  f"   Warnings: {len(warnings)}\n"
+                  f"   Passed Checks: {len(passed)}")
+        
+        if cache_path:
+            self._store_cached_result(cache_path, result)
         
         return result
 
@@ -2773,7 +3268,51 @@ class AdvancedSEOAuditor:
 SEOAuditor = AdvancedSEOAuditor
 
 
-def print_audit_report(result: SEOAuditResult):
+# Check glyphs indexed by a bool: _TF[False], _TF[True]
+_TF = ("❌", "✅")
+
+# Banner and summary block of the printed report, formatted with format_map()
+_REPORT_TMPL = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    ADVANCED SEO AUDIT REPORT (200+ Parameters)               ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║  URL: {url} ║
+║  Date: {r.audit_date:<64} ║
+║  Score: {score_indicator} {r.score}/100 (Grade: {r.grade}){pad} ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+📊 SUMMARY: ✅ Passed: {r.checks_passed} | ⚠️ Warnings: {r.checks_warnings} | ❌ Critical: {r.checks_failed}
+   Response: {r.response_time:.2f}s | Size: {r.page_size_kb}KB
+
+📋 META: Title {r.title_status} ({r.title_length}ch) | Desc {r.meta_description_status} ({r.meta_description_length}ch)
+🌐 SOCIAL: OG {r.og_score}% | Twitter {r.twitter_score}%
+📝 HEADINGS: H1:{r.h1_count} H2:{r.h2_count} H3:{r.h3_count} | {r.heading_structure_status}
+🖼️ IMAGES: {r.total_images} total | {r.images_without_alt} missing alt | Lazy:{r.images_with_lazy_loading}
+🔗 LINKS: Internal:{r.internal_links} External:{r.external_links} | Score:{r.links_score}
+⚙️ TECH: SSL:{ssl} Viewport:{viewport} Schema:{schema}
+📖 CONTENT: {r.word_count} words | Readability: {r.readability_status}
+📱 MOBILE: {mobile} | AMP:{amp}
+♿ A11Y: Score {r.accessibility_score}/100 | ⚡ PERF: Score {r.performance_hints_score}/100
+"""
+
+
+def _fit(text: str, width: int) -> str:
+    """Truncate text to width (marking the cut with …) and pad it to exactly width"""
+    if len(text) > width:
+        text = text[:width - 1] + "…"
+    return text.ljust(width)
+
+
+def _section(parts: List[str], title: str, marker: str, items: List[str], limit: int = 10):
+    """Append a titled list of up to limit items to parts; empty sections are left out"""
+    if not items:
+        return
+    parts.append(f"\n{title}:\n")
+    parts.extend(f"   {marker} {item}\n" for item in islice(items, limit))
+
+
+def build_audit_report(result: SEOAuditResult) -> str:
+    """Render the plain-text report for a result without printing it"""
     if result.score >= 80:
         score_indicator = "🟢"
     elif result.score >= 60:
@@ -2781,60 +3320,103 @@ def print_audit_report(result: SEOAuditResult):
     else:
         score_indicator = "🔴"
     
-    report = f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                    ADVANCED SEO AUDIT REPORT (200+ Parameters)               ║
-╠══════════════════════════════════════════════════════════════════════════════╣
-║  URL: {result.url[:65]:<65} ║
-║  Date: {result.audit_date:<64} ║
-║  Score: {score_indicator} {result.score}/100 (Grade: {result.grade}){' ' * 50} ║
-╚══════════════════════════════════════════════════════════════════════════════╝
+    parts = [_REPORT_TMPL.format_map({
+        "r": result,
+        "url": _fit(result.url, 65),
+        "score_indicator": score_indicator,
+        "pad": ' ' * 50,
+        "ssl": _TF[bool(result.has_ssl)],
+        "viewport": _TF[bool(result.has_viewport)],
+        "schema": _TF[bool(result.has_schema_markup)],
+        "mobile": _TF[bool(result.is_mobile_friendly)],
+        "amp": _TF[bool(result.has_amp_version)],
+    })]
+    
+    _section(parts, "🚨 CRITICAL ISSUES", "❌", result.critical_issues)
+    _section(parts, "⚠️ WARNINGS", "⚠️", result.warnings)
+    _section(parts, "💡 RECOMMENDATIONS", "💡", result.recommendations)
+    
+    return "".join(parts)
 
-📊 SUMMARY: ✅ Passed: {result.checks_passed} | ⚠️ Warnings: {result.checks_warnings} | ❌ Critical: {result.checks_failed}
-   Response: {result.response_time:.2f}s | Size: {result.page_size_kb}KB
 
-📋 META: Title {result.title_status} ({result.title_length}ch) | Desc {result.meta_description_status} ({result.meta_description_length}ch)
-🌐 SOCIAL: OG {result.og_score}% | Twitter {result.twitter_score}%
-📝 HEADINGS: H1:{result.h1_count} H2:{result.h2_count} H3:{result.h3_count} | {result.heading_structure_status}
-🖼️ IMAGES: {result.total_images} total | {result.images_without_alt} missing alt | Lazy:{result.images_with_lazy_loading}
-🔗 LINKS: Internal:{result.internal_links} External:{result.external_links} | Score:{result.links_score}
-⚙️ TECH: SSL:{'✅' if result.has_ssl else '❌'} Viewport:{'✅' if result.has_viewport else '❌'} Schema:{'✅' if result.has_schema_markup else '❌'}
-📖 CONTENT: {result.word_count} words | Readability: {result.readability_status}
-📱 MOBILE: {'✅' if result.is_mobile_friendly else '❌'} | AMP:{'✅' if result.has_amp_version else '❌'}
-♿ A11Y: Score {result.accessibility_score}/100 | ⚡ PERF: Score {result.performance_hints_score}/100
-"""
-    
-    if result.critical_issues:
-        report += "\n🚨 CRITICAL ISSUES:\n"
-        for issue in result.critical_issues[:10]:
-            report += f"   ❌ {issue}\n"
-    
-    if result.warnings:
-        report += "\n⚠️ WARNINGS:\n"
-        for warning in result.warnings[:10]:
-            report += f"   ⚠️ {warning}\n"
-    
-    if result.recommendations:
-        report += "\n💡 RECOMMENDATIONS:\n"
-        for rec in result.recommendations[:10]:
-            report += f"   💡 {rec}\n"
-    
-    print(report)
+def print_audit_report(result: SEOAuditResult):
+    report = build_audit_report(result)
+    sys.stdout.write(report + "\n")
     return report
 
 
-def save_report_json(result: SEOAuditResult, filename: str = None):
+# (name, default) for every result field; factory defaults are built once, only for comparison
+_RESULT_DEFAULTS = tuple(
+    (f.name, f.default if f.default is not MISSING
+     else f.default_factory() if f.default_factory is not MISSING else MISSING)
+    for f in fields(SEOAuditResult)
+)
+
+
+def _to_jsonable(result: SEOAuditResult, skip_defaults: bool = False) -> Dict[str, Any]:
+    """Shallow field dict of a result (no asdict() deep copy), optionally without default values"""
+    if not skip_defaults:
+        return {name: getattr(result, name) for name, _ in _RESULT_DEFAULTS}
+    out = {}
+    for name, default in _RESULT_DEFAULTS:
+        value = getattr(result, name)
+        if default is MISSING or value != default:
+            out[name] = value
+    return out
+
+
+def _result_json(result: SEOAuditResult, skip_defaults: bool = False) -> bytes:
+    if orjson is not None:
+        # orjson serializes the dataclass directly, without an asdict() deep copy
+        data = _to_jsonable(result, skip_defaults) if skip_defaults else result
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(_to_jsonable(result, skip_defaults), indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def save_report_json(result: SEOAuditResult, filename: str = None, skip_defaults: bool = False):
     if filename is None:
-        domain = urlparse(result.url).netloc.replace('.', '_')
-        filename = f"audit_{domain}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        domain = result.domain_slug or urlparse(result.url).netloc.replace('.', '_')
+        # audit_date is "%Y-%m-%d %H:%M:%S"; same file name format as before, but tied to the audit
+        stamp = result.audit_date.replace('-', '').replace(':', '').replace(' ', '_')
+        filename = f"audit_{domain}_{stamp}.json"
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(asdict(result), f, indent=2, ensure_ascii=False, default=str)
+    with open(filename, 'wb') as f:
+        f.write(_result_json(result, skip_defaults))
     
     print(f"\n📁 JSON Report saved to: {filename}")
     return filename
 
 
+def _write_bytes(path: str, payload: bytes) -> str:
+    _write_atomic(path, payload)
+    return path
+
+
+def save_reports_batch(reports: List[Tuple[SEOAuditResult, str]], max_workers: int = 8) -> List[str]:
+    """Save many results as JSON at once; returns the paths written
+    
+    Every result is serialized up front, then the files are written from a
+    small thread pool so the blocking open/write/close calls overlap. Each
+    file is replaced atomically, and a result that fails to serialize or
+    write is reported and skipped without stopping the rest.
+    """
+    payloads = []
+    for result, path in reports:
+        try:
+            payloads.append((path, _result_json(result)))
+        except (TypeError, ValueError) as e:
+            print(f"❌ Error serializing JSON for {result.url}: {e}")
+    written = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(payloads)))) as executor:
+        futures = [executor.submit(_write_bytes, path, payload) for path, payload in payloads]
+        for (path, _), future in zip(payloads, futures):
+            try:
+                written.append(future.result())
+            except OSError as e:
+                print(f"❌ Error saving JSON to {path}: {e}")
+    return written
+
+
 def main():
     print("""
     ╔═══════════════════════════════════════════════════════════════════════════╗
@@ -388,12 +388,12 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 try:
-    from seo_auditor import AdvancedSEOAuditor, SEOAuditResult, print_audit_report
+    from seo_auditor import AdvancedSEOAuditor, SEOAuditResult, build_audit_report, HTML_PARSER
 except KeyError:
     # Handle Python 3.13 import issue - clear and retry
     if 'seo_auditor' in sys.modules:
         del sys.modules['seo_auditor']
-    from seo_auditor import AdvancedSEOAuditor, SEOAuditResult, print_audit_report
+    from seo_auditor import AdvancedSEOAuditor, SEOAuditResult, build_audit_report, HTML_PARSER
 
 
 def display_score_card(result):
@@ -920,7 +920,7 @@ def display_export(result):
         )
     
     with col2:
-        text_report = print_audit_report(result)
+        text_report = build_audit_report(result)
         st.download_button(
             label="Text Report",
             data=text_report,
@@ -1267,7 +1267,7 @@ def main():
                     st.success(f"✅ HTTP Status: **{response.status_code}** | Content: **{len(response.text):,}** chars | Time: **{fetch_duration:.2f}s**")
                 
                 if response.status_code == 200:
-                    soup = BS(response.text, 'html.parser')
+                    soup = BS(response.text, HTML_PARSER)
                     title_tag = soup.find('title')
                     meta_desc = soup.find('meta', attrs={'name': 'description'})
                     